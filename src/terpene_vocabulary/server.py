@@ -13,759 +13,864 @@ The server provides:
 """
 
 from fastmcp import FastMCP
-from typing import Optional, Literal
+from typing import List, Optional, Literal, NamedTuple, Tuple
+from bisect import bisect_right
+from enum import IntEnum
+from functools import lru_cache
+from pathlib import Path
+import ctypes
 import json
+import math
+import random
+import re
+import sys
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 mcp = FastMCP("terpene-vocabulary")
 
+
+class _FrozenDict(dict):
+    """Read-only dict. Still a real dict, so json.dumps serializes it unchanged."""
+
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+
+def _freeze(value):
+    """Recursively convert dicts to _FrozenDict, lists to tuples and intern strings."""
+    if isinstance(value, dict):
+        return _FrozenDict((sys.intern(k), _freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
 # ============================================================================
 # TERPENE DATABASE
 # ============================================================================
+# The vocabulary lives in terpenes.json next to this module and is decoded
+# once at import. Repeated tokens ("Soft", "Very soft", stage names) share one
+# interned object and the database cannot be mutated at runtime.
 
-TERPENES = {
-    "limonene": {
-        "name": "Limonene",
-        "molecular_formula": "C₁₀H₁₆",
-        "classification": "Monocyclic monoterpene",
-        "scent_profile": "Bright, citrus, sharp, zesty, fresh, sweet-tart",
-        "visual_character": "Crisp, radial, high-luminosity",
-        "primary_colors": ["Saturated yellow", "Orange", "Bright white"],
-        "color_specs": {
-            "primary_palette": "Saturated yellows (60%), oranges (25%), whites/highlights (15%)",
-            "saturation": "High (75-95%)",
-            "luminosity": "Very bright (80-90%)",
-            "boundaries": "Crisp transitions",
-            "secondary_accents": "White highlights, pale lemon",
-            "color_quality": "Transparent, translucent quality"
-        },
-        "composition": "Concentric spirals, radial symmetry, angular forms",
-        "temporal_qualities": {
-            "volatility": "Highly volatile",
-            "persistence": "Rapid dissipation",
-            "stages": {
-                "fresh": {
-                    "duration": "0-2 hours",
-                    "description": "Sharp edges, maximal saturation, crisp geometry, intense highlights",
-                    "saturation_adjustment": 1.0,
-                    "luminosity_adjustment": 1.0,
-                    "edge_quality": "Crisp"
-                },
-                "active": {
-                    "duration": "2-6 hours",
-                    "description": "Slight softening at boundaries, saturation fading marginally",
-                    "saturation_adjustment": 0.85,
-                    "luminosity_adjustment": 0.95,
-                    "edge_quality": "Mostly crisp"
-                },
-                "fading": {
-                    "duration": "6-12 hours",
-                    "description": "Edges blur significantly, saturation drops to 40-60%, highlights diffuse",
-                    "saturation_adjustment": 0.5,
-                    "luminosity_adjustment": 0.85,
-                    "edge_quality": "Soft"
-                },
-                "traces": {
-                    "duration": "12+ hours",
-                    "description": "Ghost impressions, pale yellows, very soft edges",
-                    "saturation_adjustment": 0.2,
-                    "luminosity_adjustment": 0.7,
-                    "edge_quality": "Very soft"
-                }
-            }
-        },
-        "master_prompt": "Limonene generates crisp, radially symmetrical compositions in saturated yellows and oranges with bright white highlights. Concentric spirals emanate from a luminous center, suggesting broadcast signals of ripeness and attraction. The geometry is clean and angular—pointed edges catch sharp light. Colors transition acidically from warm yellow-orange cores to paler lemon tones at boundaries. High luminosity throughout, with minimal shadow depth. The composition captures volatility through crisp definition gradually softening at margins, as if the bright aromatic signal is dispersing into air, leaving fading citrus-colored traces.",
-        "chemical_communication": "Signals ripeness and food sources to insects; broadcast/attractant quality",
-        "fusion_strength": "Strong - works well with concepts involving visibility, broadcasting, energy",
-        "semantic_bridges": ["radial presence", "broadcasting", "visibility", "bright presence", "citrus warmth"]
-    },
-    
-    "pinene": {
-        "name": "Pinene",
-        "molecular_formula": "C₁₀H₁₆",
-        "classification": "Bicyclic monoterpene",
-        "scent_profile": "Woody, sharp, fresh-resinous, piney, slightly medicinal, clean",
-        "visual_character": "Sharp, geometric, defensive, crystalline",
-        "primary_colors": ["Deep green", "Amber", "Cool white"],
-        "color_specs": {
-            "primary_palette": "Deep greens (50%), amber/brown (30%), cool whites (20%)",
-            "saturation": "Medium-high (65-80%)",
-            "luminosity": "Medium (50-70%)",
-            "boundaries": "Sharper than earthy terpenes",
-            "secondary_accents": "Cool gray-whites, forest-deep greens",
-            "color_quality": "Translucent, amber-like clarity"
-        },
-        "composition": "Interlocking planes, angular forms, needle-like protrusions, layered depth",
-        "temporal_qualities": {
-            "volatility": "Moderately volatile",
-            "persistence": "More stable than limonene",
-            "stages": {
-                "fresh": {
-                    "duration": "0-4 hours",
-                    "description": "Sharp needle-like edges, deep green saturation, crisp amber highlights",
-                    "saturation_adjustment": 1.0,
-                    "luminosity_adjustment": 1.0,
-                    "edge_quality": "Sharp"
-                },
-                "active": {
-                    "duration": "4-12 hours",
-                    "description": "Slight dulling, amber becoming opaque",
-                    "saturation_adjustment": 0.8,
-                    "luminosity_adjustment": 0.9,
-                    "edge_quality": "Mostly sharp"
-                },
-                "fading": {
-                    "duration": "12-24 hours",
-                    "description": "Geometric sharpness softens, colors muting and becoming earthy",
-                    "saturation_adjustment": 0.5,
-                    "luminosity_adjustment": 0.75,
-                    "edge_quality": "Soft"
-                },
-                "traces": {
-                    "duration": "24+ hours",
-                    "description": "Pale greens and warm browns remain, edges very soft",
-                    "saturation_adjustment": 0.25,
-                    "luminosity_adjustment": 0.6,
-                    "edge_quality": "Very soft"
-                }
-            }
-        },
-        "master_prompt": "Pinene generates complex, interlocking geometric compositions in deep greens and warm ambers. Bicyclic molecular structure translates to tightly-locked angular forms suggesting both structural rigidity and defensive positioning. Needle-like protrusions catch sharp, cool light while creating layered shadow depth. Saturation is medium-high but cooler in tone than limonene. The composition reads as crystalline and precise—resinous amber captured within geometric boundaries. Sharp edges and crisp intersections gradually soften over time, with bright amber highlights becoming warmer and deeper greens mellowing into earthy forest tones as the volatile pinene disperses.",
-        "chemical_communication": "Signals plant defense and territorial marking; defensive/protective quality",
-        "fusion_strength": "Strong - works well with concepts involving precision, defense, complexity, structure",
-        "semantic_bridges": ["defensive geometry", "crystalline precision", "territorial marking", "rigidity", "woody depth"]
-    },
-    
-    "myrcene": {
-        "name": "Myrcene",
-        "molecular_formula": "C₁₀H₁₆",
-        "classification": "Acyclic monoterpene",
-        "scent_profile": "Earthy, musky, herbal, spicy, clove-like, slightly fruity, warm",
-        "visual_character": "Flowing, organic, earthy, distributed",
-        "primary_colors": ["Warm brown", "Ochre", "Deep green"],
-        "color_specs": {
-            "primary_palette": "Warm browns (40%), ochres/earth tones (35%), deep greens (20%), golden accents (5%)",
-            "saturation": "Medium-low (50-65%)",
-            "luminosity": "Lower (35-50%)",
-            "boundaries": "Soft, blurred transitions",
-            "secondary_accents": "Clove-warm spice tones, muted olive greens",
-            "color_quality": "Opaque, earthy, matte quality"
-        },
-        "composition": "Flowing ribbons, directional movement, organic shapes, non-geometric",
-        "temporal_qualities": {
-            "volatility": "Moderately volatile",
-            "persistence": "Slightly more stable than monoterpenes",
-            "stages": {
-                "fresh": {
-                    "duration": "0-6 hours",
-                    "description": "Richest color saturation, slight green freshness visible",
-                    "saturation_adjustment": 1.0,
-                    "luminosity_adjustment": 1.0,
-                    "edge_quality": "Soft but defined"
-                },
-                "active": {
-                    "duration": "6-12 hours",
-                    "description": "Green tones fade, browns become dominant",
-                    "saturation_adjustment": 0.75,
-                    "luminosity_adjustment": 0.85,
-                    "edge_quality": "Soft"
-                },
-                "fading": {
-                    "duration": "12-24 hours",
-                    "description": "Color becomes muddier, warm tones persist",
-                    "saturation_adjustment": 0.45,
-                    "luminosity_adjustment": 0.7,
-                    "edge_quality": "Very soft"
-                },
-                "traces": {
-                    "duration": "24+ hours",
-                    "description": "Muted earth tones remain, very soft focus",
-                    "saturation_adjustment": 0.2,
-                    "luminosity_adjustment": 0.5,
-                    "edge_quality": "Very soft"
-                }
-            }
-        },
-        "master_prompt": "Myrcene generates flowing, organic compositions dominated by warm earths, ochres, and muted greens. The linear molecular structure translates to ribbon-like forms moving through space with clear directional vectors, undulating and flexible rather than rigid. Saturation is deliberately lower and luminosity muted, creating a grounded, earthy aesthetic. Boundaries between color zones are soft and blurred, as if the composition is diffusing its presence throughout the surrounding space like distributed herbal signals. No sharp highlights or crisp edges—instead, everything has matte, warm, musky quality. Over time, green freshness fades while warm earth tones persist, eventually becoming indistinct traces of ochre and brown.",
-        "chemical_communication": "Signals plant maturity and growth; distributed/expansive quality",
-        "fusion_strength": "Strong - works well with organic subjects, landscapes, movement, growth",
-        "semantic_bridges": ["flowing movement", "earthy grounding", "organic growth", "distributed presence", "natural unfolding"]
-    },
-    
-    "caryophyllene": {
-        "name": "Caryophyllene",
-        "molecular_formula": "C₁₅H₂₄",
-        "classification": "Bicyclic sesquiterpene",
-        "scent_profile": "Spicy, peppery, woody, warm, slightly sweet, clove-like, complex, sophisticated",
-        "visual_character": "Layered, complex, deep, warm-spiced",
-        "primary_colors": ["Deep burgundy", "Rich brown", "Warm amber"],
-        "color_specs": {
-            "primary_palette": "Deep warm browns (35%), rich reds/burgundy (25%), amber (20%), dark earth tones (20%)",
-            "saturation": "Medium (60-75%)",
-            "luminosity": "Medium-low (45-60%)",
-            "boundaries": "Some crisp, mostly soft",
-            "secondary_accents": "Deep burgundy highlights, warm copper tones",
-            "color_quality": "Rich, sophisticated, translucent amber"
-        },
-        "composition": "Interlocking forms, layered depth, complex structural relationships",
-        "temporal_qualities": {
-            "volatility": "Low volatility - sesquiterpene",
-            "persistence": "Persists much longer than monoterpenes",
-            "stages": {
-                "fresh": {
-                    "duration": "0-12 hours",
-                    "description": "Rich saturation, deep burgundy prominent, warmest amber highlights",
-                    "saturation_adjustment": 1.0,
-                    "luminosity_adjustment": 1.0,
-                    "edge_quality": "Defined"
-                },
-                "active": {
-                    "duration": "12-48 hours",
-                    "description": "Saturation holds, colors remain sophisticated and deep",
-                    "saturation_adjustment": 0.9,
-                    "luminosity_adjustment": 0.95,
-                    "edge_quality": "Defined"
-                },
-                "fading": {
-                    "duration": "48-72 hours",
-                    "description": "Gradual dulling, warm tones becoming more uniform",
-                    "saturation_adjustment": 0.65,
-                    "luminosity_adjustment": 0.8,
-                    "edge_quality": "Soft"
-                },
-                "traces": {
-                    "duration": "72+ hours",
-                    "description": "Deep browns remain, complexity fades",
-                    "saturation_adjustment": 0.35,
-                    "luminosity_adjustment": 0.6,
-                    "edge_quality": "Soft"
-                }
-            }
-        },
-        "master_prompt": "Caryophyllene generates sophisticated, densely-layered compositions in deep burgundy, rich browns, warm amber, and dark earth tones. The bicyclic sesquiterpene structure creates interlocking forms more complex than smaller terpenes, suggesting both resilience and sophisticated molecular communication. Saturation is medium and warmth permeates throughout—no cool tones. Luminosity is deliberately held lower, creating visual weight and substance. The composition reads as layered complexity, with burgundy and amber creating depth within warm darkness. Unlike volatile monoterpenes, caryophyllene's persistence translates to long-lasting visual richness—colors and complexity maintain their depth over time before gradually simplifying into muted warm earth tones.",
-        "chemical_communication": "Signals plant defense and stress response; complex ecological communication",
-        "fusion_strength": "Strong - works well with sophisticated subjects, emotional depth, complexity",
-        "semantic_bridges": ["sophisticated depth", "warm presence", "complex resilience", "spiced warmth", "layered intelligence"]
-    },
-    
-    "linalool": {
-        "name": "Linalool",
-        "molecular_formula": "C₁₀H₁₈O",
-        "classification": "Acyclic monoterpene alcohol",
-        "scent_profile": "Floral, lavender, sweet, fresh, slightly fruity, delicate, soft, calming",
-        "visual_character": "Ethereal, soft, luminous, delicate",
-        "primary_colors": ["Soft purple", "Pale violet", "Luminous white"],
-        "color_specs": {
-            "primary_palette": "Soft purples/lavenders (40%), pale violets (20%), soft whites/cream (25%), pale pinks (15%)",
-            "saturation": "Low-medium (50-65%)",
-            "luminosity": "Very high (75-90%)",
-            "boundaries": "Extremely soft, watercolor-like",
-            "secondary_accents": "Pale lilac, cream highlights, soft mauve",
-            "color_quality": "Translucent, ethereal, delicate"
-        },
-        "composition": "Flowing forms, graceful geometry, delicate structures",
-        "temporal_qualities": {
-            "volatility": "Moderately volatile",
-            "persistence": "Less dramatic than some terpenes",
-            "stages": {
-                "fresh": {
-                    "duration": "0-4 hours",
-                    "description": "Richest purple saturation, brightest highlights, most luminous",
-                    "saturation_adjustment": 1.0,
-                    "luminosity_adjustment": 1.0,
-                    "edge_quality": "Very soft"
-                },
-                "active": {
-                    "duration": "4-12 hours",
-                    "description": "Slight warming in tone, purples becoming more mauve",
-                    "saturation_adjustment": 0.8,
-                    "luminosity_adjustment": 0.95,
-                    "edge_quality": "Very soft"
-                },
-                "fading": {
-                    "duration": "12-24 hours",
-                    "description": "Purples fading to pale lavenders, whites, losing saturation",
-                    "saturation_adjustment": 0.45,
-                    "luminosity_adjustment": 0.85,
-                    "edge_quality": "Very soft"
-                },
-                "traces": {
-                    "duration": "24+ hours",
-                    "description": "Pale creams and ghostly lavender washes",
-                    "saturation_adjustment": 0.15,
-                    "luminosity_adjustment": 0.75,
-                    "edge_quality": "Very soft"
-                }
-            }
-        },
-        "master_prompt": "Linalool generates ethereal, luminous compositions in soft lavenders, pale violets, and creamy whites. The acyclic structure translates to graceful, flowing forms—more delicate than other terpenes due to the hydroxyl functional group adding translucence. Saturation is deliberately kept low (50-65%) while luminosity remains very high (75-90%), creating an airy, almost watercolor-like aesthetic. Boundaries are extremely soft and blurred, suggesting delicate dissolution into surrounding space. The palette maintains cool tones but reads as warm and inviting through ethereal quality. Forms appear graceful and gently communicative rather than signaling forcefully. Linalool's moderate volatility means the composition gradually transitions from rich lavender luminescence to pale ghostly traces, fading delicately over extended time.",
-        "chemical_communication": "Signals attraction and gentle communication; calming/peaceful quality",
-        "fusion_strength": "Strong - works well with delicate subjects, romantic concepts, spiritual themes",
-        "semantic_bridges": ["ethereal presence", "graceful communication", "floral softness", "calming luminescence", "delicate transcendence"]
-    },
-    
-    "terpinolene": {
-        "name": "Terpinolene",
-        "molecular_formula": "C₁₀H₁₆",
-        "classification": "Bicyclic monoterpene with exocyclic double bond",
-        "scent_profile": "Fresh, herbal, woody, piney, slightly fruity, complex, crisp, sophisticated",
-        "visual_character": "Fresh, complex, crisp, sophisticated",
-        "primary_colors": ["Fresh green", "Crisp white", "Soft earth"],
-        "color_specs": {
-            "primary_palette": "Fresh greens (35%), crisp whites/highlights (25%), soft earths (20%), cool grays (15%), pale yellows (5%)",
-            "saturation": "Medium (65-75%)",
-            "luminosity": "High (70-85%)",
-            "boundaries": "Mixed - some crisp, some soft",
-            "secondary_accents": "Pale sage, cool gray-greens, soft golden",
-            "color_quality": "Translucent in some zones, opaque in others"
-        },
-        "composition": "Complex geometric forms with outward-reaching elements, balanced structure and motion",
-        "temporal_qualities": {
-            "volatility": "Volatile",
-            "persistence": "Dissipates relatively quickly",
-            "stages": {
-                "fresh": {
-                    "duration": "0-3 hours",
-                    "description": "Brightest greens, sharpest highlights, most complex saturation",
-                    "saturation_adjustment": 1.0,
-                    "luminosity_adjustment": 1.0,
-                    "edge_quality": "Mixed crisp/soft"
-                },
-                "active": {
-                    "duration": "3-9 hours",
-                    "description": "Slight softening, green intensity maintaining",
-                    "saturation_adjustment": 0.85,
-                    "luminosity_adjustment": 0.95,
-                    "edge_quality": "Mostly soft"
-                },
-                "fading": {
-                    "duration": "9-18 hours",
-                    "description": "Greens muting, sophistication fading to simpler herbal",
-                    "saturation_adjustment": 0.55,
-                    "luminosity_adjustment": 0.8,
-                    "edge_quality": "Soft"
-                },
-                "traces": {
-                    "duration": "18+ hours",
-                    "description": "Pale greens and soft grays remain",
-                    "saturation_adjustment": 0.25,
-                    "luminosity_adjustment": 0.65,
-                    "edge_quality": "Very soft"
-                }
-            }
-        },
-        "master_prompt": "Terpinolene generates sophisticated fresh compositions with complex geometric layering in vibrant greens, crisp whites, earthy undertones, and cool grays. The unusual bicyclic structure with exocyclic double bond creates visual tension between internal geometric stability and outward-reaching motion. Saturation is medium-high with high luminosity, creating crisp, airy aesthetic distinct from other fresh terpenes. The composition reads as sophisticated freshness—not simple brightness, but rather complex herbal clarity with geometric precision. Boundaries are deliberately mixed: some areas crisp and defined, others softer, reflecting structural complexity. Terpinolene's volatility means the composition gradually transitions from complex geometric freshness to muted herbal tones over roughly 18 hours, with bright greens fading first.",
-        "chemical_communication": "Signals plant vitality and complex ecological information; sophisticated presence",
-        "fusion_strength": "Medium-strong - works well with intellectual/sophisticated concepts",
-        "semantic_bridges": ["sophisticated freshness", "complex clarity", "herbal precision", "outward expansion", "geometric grace"]
-    },
-    
-    "humulene": {
-        "name": "Humulene",
-        "molecular_formula": "C₁₅H₂₄",
-        "classification": "Bicyclic sesquiterpene (isomer of caryophyllene)",
-        "scent_profile": "Hoppy, woody, earthy, spicy, herbal, complex, slightly sweet",
-        "visual_character": "Earthy, warm, grounded, hoppy-golden",
-        "primary_colors": ["Rich brown", "Golden-amber", "Earth tones"],
-        "color_specs": {
-            "primary_palette": "Rich browns (35%), golden-amber (25%), deep earth (20%), subtle greens (10%), warm accents (10%)",
-            "saturation": "Medium (65-75%)",
-            "luminosity": "Medium (50-65%)",
-            "boundaries": "Soft-to-medium transitions",
-            "secondary_accents": "Hoppy gold, muted sage, warm copper",
-            "color_quality": "Warm, substantial, golden translucence"
-        },
-        "composition": "Complex interlocking forms, earthy grounding, natural flow",
-        "temporal_qualities": {
-            "volatility": "Low volatility - sesquiterpene",
-            "persistence": "Long-lasting like caryophyllene",
-            "stages": {
-                "fresh": {
-                    "duration": "0-12 hours",
-                    "description": "Rich golden-brown saturation, warmest amber highlights",
-                    "saturation_adjustment": 1.0,
-                    "luminosity_adjustment": 1.0,
-                    "edge_quality": "Soft-defined"
-                },
-                "active": {
-                    "duration": "12-48 hours",
-                    "description": "Saturation holding steady, complexity visible",
-                    "saturation_adjustment": 0.88,
-                    "luminosity_adjustment": 0.95,
-                    "edge_quality": "Soft-defined"
-                },
-                "fading": {
-                    "duration": "48-72 hours",
-                    "description": "Cooling from gold to neutral brown",
-                    "saturation_adjustment": 0.65,
-                    "luminosity_adjustment": 0.8,
-                    "edge_quality": "Soft"
-                },
-                "traces": {
-                    "duration": "72+ hours",
-                    "description": "Deep muted browns remain",
-                    "saturation_adjustment": 0.35,
-                    "luminosity_adjustment": 0.6,
-                    "edge_quality": "Soft"
-                }
-            }
-        },
-        "master_prompt": "Humulene generates complex, earthy compositions in golden-browns, warm earth tones, subtle herbal greens, and amber highlights. As a sesquiterpene isomer of caryophyllene, humulene shares similar structural complexity and visual density, but reads distinctly more earthy and hoppy-golden rather than deeply burgundy and spiced. Saturation is medium with medium luminosity, creating substantial aesthetic. Boundaries are softer than caryophyllene, reflecting humulene's slightly different spatial configuration. The palette maintains warm golden undertones throughout. Composition suggests herbal grounding and transformation (fermentation) rather than deep mystery. Like other sesquiterpenes, humulene persists significantly longer than monoterpenes, maintaining warm golden-brown complexity over 48+ hours before gradually transitioning to simpler muted earth tones.",
-        "chemical_communication": "Signals hop plant presence and fermentation; grounding/transformation quality",
-        "fusion_strength": "Strong - works well with earthy, grounded, natural subjects",
-        "semantic_bridges": ["hoppy warmth", "earthy grounding", "fermentation transformation", "herbal complexity", "golden presence"]
-    },
-    
-    "ocimene": {
-        "name": "Ocimene",
-        "molecular_formula": "C₁₀H₁₆",
-        "classification": "Acyclic monoterpene",
-        "scent_profile": "Floral, sweet, herbal, fruity, slightly spicy, fresh, delicate",
-        "visual_character": "Delicate, flowing, pastel, energetic",
-        "primary_colors": ["Pale pink", "Soft green", "Creamy white"],
-        "color_specs": {
-            "primary_palette": "Soft pastels—pale pinks (25%), soft greens (25%), creamy whites (25%), pale yellows (15%), soft lavenders (10%)",
-            "saturation": "Low (45-60%)",
-            "luminosity": "High (75-90%)",
-            "boundaries": "Soft, watercolor-like",
-            "secondary_accents": "Pale sage, soft apricot, cream",
-            "color_quality": "Translucent, delicate, luminous"
-        },
-        "composition": "Flowing graceful forms with subtle energetic quality, delicate but dynamic",
-        "temporal_qualities": {
-            "volatility": "Highly volatile",
-            "persistence": "Quick dissipation",
-            "stages": {
-                "fresh": {
-                    "duration": "0-4 hours",
-                    "description": "Richest pastel saturation, brightest highlights, most color",
-                    "saturation_adjustment": 1.0,
-                    "luminosity_adjustment": 1.0,
-                    "edge_quality": "Soft"
-                },
-                "active": {
-                    "duration": "4-10 hours",
-                    "description": "Slight softening, delicate quality increasing",
-                    "saturation_adjustment": 0.75,
-                    "luminosity_adjustment": 0.95,
-                    "edge_quality": "Soft"
-                },
-                "fading": {
-                    "duration": "10-20 hours",
-                    "description": "Pastels becoming pale and washed out",
-                    "saturation_adjustment": 0.35,
-                    "luminosity_adjustment": 0.85,
-                    "edge_quality": "Very soft"
-                },
-                "traces": {
-                    "duration": "20+ hours",
-                    "description": "Ghost-like pale washes",
-                    "saturation_adjustment": 0.1,
-                    "luminosity_adjustment": 0.75,
-                    "edge_quality": "Very soft"
-                }
-            }
-        },
-        "master_prompt": "Ocimene generates delicate, luminous compositions in soft pastels (pale pinks, soft greens, creams, pale yellows, soft lavenders). The acyclic structure with extended conjugation creates flowing, graceful forms suggesting subtle energetic quality—not rigid, but gently dynamic. Saturation is deliberately kept low (45-60%) while luminosity remains very high (75-90%), creating ethereal aesthetic. Boundaries are extremely soft and watercolor-like. The composition reads as delicate and communicative rather than forceful, with graceful motion throughout. Like other volatile monoterpenes, ocimene's brightness rapidly fades over 10-20 hours, with rich pastels transitioning through pale washes to ghost-like traces before dissipating.",
-        "chemical_communication": "Signals plant attraction and nuanced communication; graceful/energetic quality",
-        "fusion_strength": "Medium-strong - works well with delicate, dynamic, artistic concepts",
-        "semantic_bridges": ["graceful motion", "delicate energy", "subtle communication", "pastoral softness", "energetic flow"]
-    },
-    
-    "sabinene": {
-        "name": "Sabinene",
-        "molecular_formula": "C₁₀H₁₆",
-        "classification": "Bicyclic monoterpene with exocyclic double bond",
-        "scent_profile": "Spicy, peppery, warm, woody, slightly bitter, herbal, sharp",
-        "visual_character": "Warm, spiced, sharp, dynamic",
-        "primary_colors": ["Warm brown", "Spice red", "Golden tone"],
-        "color_specs": {
-            "primary_palette": "Warm browns (30%), spice reds (25%), golden tones (20%), dark earth (15%), warm highlights (10%)",
-            "saturation": "Medium-high (70-80%)",
-            "luminosity": "Medium (55-70%)",
-            "boundaries": "Mixed - dynamic quality",
-            "secondary_accents": "Peppery red, golden amber, warm copper",
-            "color_quality": "Warm, spiced, translucent amber"
-        },
-        "composition": "Warm geometric forms with outward-reaching quality, dynamic structural tension",
-        "temporal_qualities": {
-            "volatility": "Moderately volatile",
-            "persistence": "Slower dissipation than limonene",
-            "stages": {
-                "fresh": {
-                    "duration": "0-5 hours",
-                    "description": "Richest red and golden saturation, sharpest contrasts",
-                    "saturation_adjustment": 1.0,
-                    "luminosity_adjustment": 1.0,
-                    "edge_quality": "Sharp"
-                },
-                "active": {
-                    "duration": "5-12 hours",
-                    "description": "Saturation holding, warmth persisting",
-                    "saturation_adjustment": 0.82,
-                    "luminosity_adjustment": 0.92,
-                    "edge_quality": "Mostly sharp"
-                },
-                "fading": {
-                    "duration": "12-24 hours",
-                    "description": "Reds fading to browns, highlights duller",
-                    "saturation_adjustment": 0.5,
-                    "luminosity_adjustment": 0.75,
-                    "edge_quality": "Mixed"
-                },
-                "traces": {
-                    "duration": "24+ hours",
-                    "description": "Warm browns remain, peppery character gone",
-                    "saturation_adjustment": 0.25,
-                    "luminosity_adjustment": 0.6,
-                    "edge_quality": "Soft"
-                }
-            }
-        },
-        "master_prompt": "Sabinene generates warm, dynamically-structured compositions in spice reds, golden tones, warm browns, and rich earth tones. The bicyclic structure with exocyclic double bond creates visual tension between contained structure and outward-reaching energy. Saturation is medium-high with medium luminosity, creating substantial warm aesthetic. Boundaries are deliberately mixed—some areas crisp and sharp, others soft—reflecting dynamic structural complexity. The palette maintains active warmth throughout, suggesting pepper and spice presence. Composition reads as containing active heat rather than passive grounding. Moderately volatile nature means rich red and golden saturation gradually transitions to warmer, duller browns over 12-24 hours, with peppery sharpness fading but warm undertones persisting longer.",
-        "chemical_communication": "Signals spice plant presence and peppery defense; warming/dynamic quality",
-        "fusion_strength": "Strong - works well with warm, active, spiced concepts",
-        "semantic_bridges": ["active warmth", "peppery presence", "dynamic heat", "spiced complexity", "warm sharpness"]
-    },
-    
-    "geraniol": {
-        "name": "Geraniol",
-        "molecular_formula": "C₁₀H₁₈O",
-        "classification": "Acyclic monoterpene alcohol",
-        "scent_profile": "Floral, rose-like, sweet, slightly fruity, fresh, delicate, sophisticated",
-        "visual_character": "Romantic, warm, ethereal, sophisticated",
-        "primary_colors": ["Soft rose pink", "Warm cream", "Pale peach"],
-        "color_specs": {
-            "primary_palette": "Soft rose pinks (35%), warm creams (25%), pale peachy tones (20%), soft lavenders (15%), white highlights (5%)",
-            "saturation": "Low-medium (55-70%)",
-            "luminosity": "High (75-90%)",
-            "boundaries": "Soft romantic transitions",
-            "secondary_accents": "Pale rose-mauve, warm peach, soft cream",
-            "color_quality": "Translucent, warm, delicate"
-        },
-        "composition": "Flowing graceful forms with warm presence, romantic aesthetic",
-        "temporal_qualities": {
-            "volatility": "Moderately volatile",
-            "persistence": "Persists slightly longer than some monoterpenes",
-            "stages": {
-                "fresh": {
-                    "duration": "0-6 hours",
-                    "description": "Richest rose-pink saturation, warmest peachy tones",
-                    "saturation_adjustment": 1.0,
-                    "luminosity_adjustment": 1.0,
-                    "edge_quality": "Soft"
-                },
-                "active": {
-                    "duration": "6-12 hours",
-                    "description": "Saturation holding, rose character remaining",
-                    "saturation_adjustment": 0.85,
-                    "luminosity_adjustment": 0.95,
-                    "edge_quality": "Soft"
-                },
-                "fading": {
-                    "duration": "12-24 hours",
-                    "description": "Pinks becoming paler and more mauve-like",
-                    "saturation_adjustment": 0.5,
-                    "luminosity_adjustment": 0.85,
-                    "edge_quality": "Soft"
-                },
-                "traces": {
-                    "duration": "24+ hours",
-                    "description": "Pale lavender-creams remain",
-                    "saturation_adjustment": 0.2,
-                    "luminosity_adjustment": 0.75,
-                    "edge_quality": "Very soft"
-                }
-            }
-        },
-        "master_prompt": "Geraniol generates sophisticated, romantic compositions in soft rose pinks, warm creams, pale peach tones, and soft lavenders. The acyclic alcohol structure (like linalool) creates graceful, flowing forms, but geraniol reads warmer and more romantic than linalool's cool lavender. Saturation is low-medium with high luminosity, creating ethereal airy aesthetic. The composition maintains translucence throughout—forms appear delicate and attractive rather than substantial. Boundaries are soft and romantic, suggesting gentle transitions and blooming quality. Color palette emphasizes warmth within delicate framework. Moderate volatility means rich rose-pink saturation and peachy warmth persist slightly longer than some monoterpenes, gradually fading to pale lavender-creams over 12-24 hours.",
-        "chemical_communication": "Signals flower attraction and romantic appeal; inviting/beautiful quality",
-        "fusion_strength": "Strong - works well with romantic, delicate, warm concepts",
-        "semantic_bridges": ["romantic presence", "floral beauty", "warm delicacy", "graceful attraction", "blooming quality"]
-    },
-    
-    "thymol": {
-        "name": "Thymol",
-        "molecular_formula": "C₁₀H₁₄O",
-        "classification": "Monoterpene phenol",
-        "scent_profile": "Herbal, thyme-like, warm, slightly spicy, medicinal, antiseptic, complex, intense",
-        "visual_character": "Structured, medicinal, herbal-sophisticated, potent",
-        "primary_colors": ["Complex green", "Warm brown", "Golden-amber"],
-        "color_specs": {
-            "primary_palette": "Complex greens (35%), warm browns (30%), golden-amber (20%), earth tones (15%)",
-            "saturation": "Medium-high (70-80%)",
-            "luminosity": "Medium (55-70%)",
-            "boundaries": "Medium sharpness - defined but not crystalline",
-            "secondary_accents": "Warm sage, medicinal copper, deep bronze",
-            "color_quality": "Warm, complex, translucent amber"
-        },
-        "composition": "Structured geometric forms, herbal complexity with medicinal precision",
-        "temporal_qualities": {
-            "volatility": "Lower volatility - phenolic compound",
-            "persistence": "Moderate persistence",
-            "stages": {
-                "fresh": {
-                    "duration": "0-8 hours",
-                    "description": "Richest green and golden saturation, sharpest definition",
-                    "saturation_adjustment": 1.0,
-                    "luminosity_adjustment": 1.0,
-                    "edge_quality": "Defined"
-                },
-                "active": {
-                    "duration": "8-24 hours",
-                    "description": "Saturation holding, complexity visible",
-                    "saturation_adjustment": 0.85,
-                    "luminosity_adjustment": 0.95,
-                    "edge_quality": "Defined"
-                },
-                "fading": {
-                    "duration": "24-48 hours",
-                    "description": "Greens muting, golden tones warming and dulling",
-                    "saturation_adjustment": 0.55,
-                    "luminosity_adjustment": 0.8,
-                    "edge_quality": "Soft"
-                },
-                "traces": {
-                    "duration": "48+ hours",
-                    "description": "Warm browns, herbal character faded",
-                    "saturation_adjustment": 0.3,
-                    "luminosity_adjustment": 0.65,
-                    "edge_quality": "Soft"
-                }
-            }
-        },
-        "master_prompt": "Thymol generates structured, sophisticated compositions in complex greens, warm browns, golden-ambers, and earth tones. The phenolic aromatic ring structure creates geometric precision and structural rigidity absent in typical terpenes. Saturation is medium-high with medium luminosity, creating substantial warm aesthetic with significant visual weight. Boundaries are defined—sharp enough to suggest medicinal clarity, but not crystalline. The composition reads as intentionally potent and historically significant rather than organically growing. Warm undertones persist throughout. Unlike more volatile monoterpenes, thymol's lower volatility means the composition maintains its rich complex saturation and medicinal character over 24+ hours, gradually warming and simplifying to muted earth tones over extended duration.",
-        "chemical_communication": "Signals antimicrobial presence and medicinal potency; structured/potent quality",
-        "fusion_strength": "Medium-strong - works well with intellectual, medicinal, historical concepts",
-        "semantic_bridges": ["medicinal potency", "structured wisdom", "herbal sophistication", "warming clarity", "intentional presence"]
-    }
+def _load_database():
+    """Decode terpenes.json, using orjson's native parser when it is installed."""
+    raw = Path(__file__).with_name("terpenes.json").read_bytes()
+    return _freeze(orjson.loads(raw) if orjson is not None else json.loads(raw))
+
+
+TERPENES = _load_database()
+
+# ============================================================================
+# DERIVED TABLES
+# ============================================================================
+# Index-aligned, column-oriented views of TERPENES for batch computation.
+# Row i describes TERPENE_IDS[i]; column s describes STAGES[s].
+
+# Patterns for the display strings parsed below, compiled once
+_DURATION_RE = re.compile(r"(\d+)(?:-(\d+)|\+) hours")  # "0-2 hours", "12+ hours"
+_PERCENT_RE = re.compile(r"([^,(—]+?)\s*\((\d+)%\)")  # "Saturated yellows (60%)"
+_RANGE_RE = re.compile(r"\((\d+)-(\d+)%\)")  # "High (75-95%)"
+
+TERPENE_IDS = tuple(TERPENES)
+TERPENE_IDX = _FrozenDict((terpene_id, i) for i, terpene_id in enumerate(TERPENE_IDS))
+TERPENE_NAMES = tuple(t["name"] for t in TERPENES.values())
+
+STAGES = ("fresh", "active", "fading", "traces")
+STAGE_IDX = _FrozenDict((stage, s) for s, stage in enumerate(STAGES))
+
+
+# Exact spellings callers commonly pass, so the usual case needs no normalization
+_ALIASES = _FrozenDict(
+    (alias, terpene_id)
+    for terpene_id, terpene in TERPENES.items()
+    for alias in (terpene_id, terpene["name"])
+)
+
+
+def _resolve(terpene_name: str) -> Optional[str]:
+    """Return the canonical terpene id for a user-supplied name, or None if unknown."""
+    terpene_id = _ALIASES.get(terpene_name)
+    if terpene_id is None:
+        terpene_id = _ALIASES.get(terpene_name.lower().strip())
+    return terpene_id
+
+
+def terpene_index(terpene_name: str) -> Optional[int]:
+    """Return the dense row index for a terpene id or name, or None if unknown."""
+    terpene_id = _resolve(terpene_name)
+    return None if terpene_id is None else TERPENE_IDX[terpene_id]
+
+
+def _stage_column(field):
+    """Collect one stage field as an (n_terpenes, n_stages) tuple table."""
+    return tuple(
+        tuple(t["temporal_qualities"]["stages"][stage][field] for stage in STAGES)
+        for t in TERPENES.values()
+    )
+
+
+# ADJUST[i][s] == (saturation_adjustment, luminosity_adjustment)
+ADJUST = tuple(
+    tuple(zip(saturation, luminosity))
+    for saturation, luminosity in zip(
+        _stage_column("saturation_adjustment"), _stage_column("luminosity_adjustment")
+    )
+)
+EDGE_QUALITY = _stage_column("edge_quality")
+
+# ADJUST_Q7[i][s] holds ADJUST[i][s] in unsigned Q1.7 fixed point (1.0 == 128), so
+# adjusting an 8-bit channel is an integer multiply and shift that maps 255 to 255
+# at full strength. Two-decimal factors lose at most 0.004 in the conversion.
+_Q7_ONE = 1 << 7
+ADJUST_Q7 = tuple(
+    tuple((round(sat * _Q7_ONE), round(lum * _Q7_ONE)) for sat, lum in row) for row in ADJUST
+)
+
+
+def apply_q7(value: int, terpene_idx: int, stage_idx: int, component: int) -> int:
+    """Scale an 8-bit value by a stage factor in fixed point.
+
+    component selects the factor: 0 for saturation, 1 for luminosity.
+    """
+    return (value * ADJUST_Q7[terpene_idx][stage_idx][component]) >> 7
+
+
+class Stage(NamedTuple):
+    """One temporal stage as a fixed-layout record; fields mirror the stage dict keys."""
+
+    duration: str
+    description: str
+    saturation_adjustment: float
+    luminosity_adjustment: float
+    edge_quality: str
+
+
+# STAGE_RECORDS[i][s] is stage STAGES[s] of terpene TERPENE_IDS[i]. Every row shares
+# the single STAGES ordering and Stage field layout instead of carrying its own keys,
+# and the values are the same interned objects held by TERPENES.
+STAGE_RECORDS = tuple(
+    tuple(Stage(**t["temporal_qualities"]["stages"][stage]) for stage in STAGES)
+    for t in TERPENES.values()
+)
+
+
+class ColorSpecs(NamedTuple):
+    """Typed view of a color_specs dict."""
+
+    primary_palette: str
+    saturation: str
+    luminosity: str
+    boundaries: str
+    secondary_accents: str
+    color_quality: str
+
+
+class TemporalQualities(NamedTuple):
+    """Typed view of a temporal_qualities dict; stages are Stage records."""
+
+    volatility: str
+    persistence: str
+    stages: Tuple[Stage, ...]  # in STAGES order
+
+
+class Terpene(NamedTuple):
+    """Typed, immutable view of one TERPENES entry with attribute access."""
+
+    name: str
+    molecular_formula: str
+    classification: str
+    scent_profile: str
+    visual_character: str
+    primary_colors: Tuple[str, ...]
+    color_specs: ColorSpecs
+    composition: str
+    temporal_qualities: TemporalQualities
+    master_prompt: str
+    chemical_communication: str
+    fusion_strength: str
+    semantic_bridges: Tuple[str, ...]
+
+
+def _build_record(terpene, stages):
+    """Build the Terpene view of one database entry, reusing its Stage records."""
+    temporal = terpene["temporal_qualities"]
+    return Terpene(**{
+        **terpene,
+        "color_specs": ColorSpecs(**terpene["color_specs"]),
+        "temporal_qualities": TemporalQualities(
+            temporal["volatility"], temporal["persistence"], stages
+        ),
+    })
+
+
+# TERPENE_RECORDS[tid].color_specs.saturation == TERPENES[tid]["color_specs"]["saturation"]
+TERPENE_RECORDS = _FrozenDict(
+    (terpene_id, _build_record(terpene, stages))
+    for (terpene_id, terpene), stages in zip(TERPENES.items(), STAGE_RECORDS)
+)
+
+
+# Canonical sRGB value (packed 0xRRGGBB) for every name used in primary_colors
+_NAME_TO_RGB = {
+    "Amber": 0xFFBF00,
+    "Bright white": 0xFFFFFF,
+    "Complex green": 0x5E7D4A,
+    "Cool white": 0xEEF3F7,
+    "Creamy white": 0xFFF8E7,
+    "Crisp white": 0xFAFCFF,
+    "Deep burgundy": 0x6D1A2B,
+    "Deep green": 0x1F4D2B,
+    "Earth tones": 0x8A6E4B,
+    "Fresh green": 0x7CC45A,
+    "Golden tone": 0xD4A537,
+    "Golden-amber": 0xDDA032,
+    "Luminous white": 0xFBF8FF,
+    "Ochre": 0xCC7722,
+    "Orange": 0xFF8C1A,
+    "Pale peach": 0xFFDAB9,
+    "Pale pink": 0xF9D5DC,
+    "Pale violet": 0xD8C8EE,
+    "Rich brown": 0x6B4226,
+    "Saturated yellow": 0xFFE84D,
+    "Soft earth": 0xB59F84,
+    "Soft green": 0xB5D6A7,
+    "Soft purple": 0xB39DDB,
+    "Soft rose pink": 0xF4B6C2,
+    "Spice red": 0xB23A26,
+    "Warm amber": 0xE89B2F,
+    "Warm brown": 0x8B5A2B,
+    "Warm cream": 0xF6E7C8,
+}
+
+# PRIMARY_RGB[i] holds the packed RGB ints of TERPENES[TERPENE_IDS[i]]["primary_colors"]
+PRIMARY_RGB = tuple(
+    tuple(_NAME_TO_RGB[color] for color in t["primary_colors"]) for t in TERPENES.values()
+)
+
+
+def rgb_for(terpene_idx: int) -> tuple:
+    """Return a terpene's primary colors as (r, g, b) tuples of 0-255 ints."""
+    return tuple((rgb >> 16, (rgb >> 8) & 0xFF, rgb & 0xFF) for rgb in PRIMARY_RGB[terpene_idx])
+
+
+def _parse_palette(primary_palette):
+    """Split "Yellows (60%), oranges (40%)" into names and weights normalized to sum to 1."""
+    parts = _PERCENT_RE.findall(primary_palette)
+    if not parts:
+        raise ValueError(f"Unrecognized primary palette: {primary_palette!r}")
+    total = sum(int(percent) for _, percent in parts)
+    names = tuple(sys.intern(name.strip()) for name, _ in parts)
+    return names, tuple(int(percent) / total for _, percent in parts)
+
+
+# PALETTE_NAMES[i][k] is mixed at weight PALETTE_WEIGHTS[i][k]; each row of weights sums to 1
+_palettes = [_parse_palette(t["color_specs"]["primary_palette"]) for t in TERPENES.values()]
+PALETTE_NAMES = tuple(names for names, _ in _palettes)
+PALETTE_WEIGHTS = tuple(weights for _, weights in _palettes)
+
+
+def _parse_range(spec):
+    """Extract "High (75-95%)" as the fractional bounds (0.75, 0.95)."""
+    match = _RANGE_RE.search(spec)
+    if match is None:
+        raise ValueError(f"Unrecognized percentage range: {spec!r}")
+    low, high = match.groups()
+    return (int(low) / 100, int(high) / 100)
+
+
+# SAT_RANGE[i] / LUM_RANGE[i] == (low, high) as fractions of full saturation/luminosity
+SAT_RANGE = tuple(_parse_range(t["color_specs"]["saturation"]) for t in TERPENES.values())
+LUM_RANGE = tuple(_parse_range(t["color_specs"]["luminosity"]) for t in TERPENES.values())
+
+
+def sample_saturation(terpene_idx: int, rng: random.Random = random) -> float:
+    """Draw a saturation uniformly from a terpene's saturation range."""
+    return rng.uniform(*SAT_RANGE[terpene_idx])
+
+
+def sample_luminosity(terpene_idx: int, rng: random.Random = random) -> float:
+    """Draw a luminosity uniformly from a terpene's luminosity range."""
+    return rng.uniform(*LUM_RANGE[terpene_idx])
+
+
+def _pool_ids(pool_index, values):
+    """Map each string to a small integer id, adding unseen strings to pool_index."""
+    return tuple(pool_index.setdefault(value, len(pool_index)) for value in values)
+
+
+# color_quality strings are comma-separated factors ("Translucent, warm, delicate")
+# that recur across terpenes. COLOR_QUALITY_IDS[i] lists ids into the shared
+# COLOR_QUALITY_FACTORS pool, so filtering by a factor is an int comparison.
+_color_quality_index = {}
+COLOR_QUALITY_IDS = tuple(
+    _pool_ids(
+        _color_quality_index,
+        (sys.intern(f.strip().lower()) for f in t["color_specs"]["color_quality"].split(",")),
+    )
+    for t in TERPENES.values()
+)
+COLOR_QUALITY_FACTORS = tuple(_color_quality_index)
+
+
+def terpenes_with_color_quality(factor: str) -> tuple:
+    """Return ids of terpenes whose color_quality includes `factor`, e.g. "delicate"."""
+    factor_id = _color_quality_index.get(factor.strip().lower())
+    return tuple(
+        terpene_id
+        for terpene_id, factor_ids in zip(TERPENE_IDS, COLOR_QUALITY_IDS)
+        if factor_id in factor_ids
+    )
+
+
+class EdgeQuality(IntEnum):
+    """Stage edge_quality descriptors, ordered from sharpest to softest."""
+
+    SHARP = 0
+    CRISP = 1
+    MOSTLY_SHARP = 2
+    MOSTLY_CRISP = 3
+    DEFINED = 4
+    SOFT_DEFINED = 5
+    SOFT_BUT_DEFINED = 6
+    MIXED_CRISP_SOFT = 7
+    MIXED = 8
+    MOSTLY_SOFT = 9
+    SOFT = 10
+    VERY_SOFT = 11
+
+    @property
+    def label(self) -> str:
+        """The descriptor as written in the database."""
+        return _EDGE_QUALITY_LABELS[self]
+
+    @classmethod
+    def from_label(cls, label: str) -> "EdgeQuality":
+        """Look up the member for a database descriptor such as "Very soft"."""
+        return _EDGE_QUALITY_BY_LABEL[label]
+
+
+_EDGE_QUALITY_LABELS = {
+    EdgeQuality.SHARP: "Sharp",
+    EdgeQuality.CRISP: "Crisp",
+    EdgeQuality.MOSTLY_SHARP: "Mostly sharp",
+    EdgeQuality.MOSTLY_CRISP: "Mostly crisp",
+    EdgeQuality.DEFINED: "Defined",
+    EdgeQuality.SOFT_DEFINED: "Soft-defined",
+    EdgeQuality.SOFT_BUT_DEFINED: "Soft but defined",
+    EdgeQuality.MIXED_CRISP_SOFT: "Mixed crisp/soft",
+    EdgeQuality.MIXED: "Mixed",
+    EdgeQuality.MOSTLY_SOFT: "Mostly soft",
+    EdgeQuality.SOFT: "Soft",
+    EdgeQuality.VERY_SOFT: "Very soft",
 }
+_EDGE_QUALITY_BY_LABEL = {label: quality for quality, label in _EDGE_QUALITY_LABELS.items()}
+
+# EDGE_Q[i][s] == EdgeQuality.from_label(EDGE_QUALITY[i][s]); compares and indexes as an int
+EDGE_Q = tuple(tuple(EdgeQuality.from_label(label) for label in row) for row in EDGE_QUALITY)
+
+
+def _build_bridge_index():
+    """Map each lowercased semantic bridge phrase, and each word in it, to the terpenes using it."""
+    index = {}
+    for terpene_id, terpene in TERPENES.items():
+        for bridge in terpene["semantic_bridges"]:
+            for key in (bridge, *bridge.split()):
+                index.setdefault(sys.intern(key.lower()), set()).add(terpene_id)
+    return _FrozenDict((key, frozenset(ids)) for key, ids in index.items())
+
+
+BRIDGE_INDEX = _build_bridge_index()
+
+
+def terpenes_for_concept(token: str) -> frozenset:
+    """Return ids of terpenes whose semantic bridges contain `token` (a phrase or word)."""
+    return BRIDGE_INDEX.get(token.lower().strip(), frozenset())
+
+
+def apply_adjustments(base_saturation: float, base_luminosity: float,
+                      terpene_idx: int, stage_idx: int) -> tuple:
+    """Scale a (saturation, luminosity) pair by a terpene's stage adjustments."""
+    saturation_adjustment, luminosity_adjustment = ADJUST[terpene_idx][stage_idx]
+    return (base_saturation * saturation_adjustment, base_luminosity * luminosity_adjustment)
+
+
+def batch_apply(terpene_idxs, stage_idxs, colors) -> list:
+    """Apply stage adjustments to many (saturation, luminosity) pairs in one pass.
+
+    The three sequences are parallel: colors[k] is adjusted by
+    ADJUST[terpene_idxs[k]][stage_idxs[k]].
+    """
+    adjusted = []
+    for terpene_idx, stage_idx, (saturation, luminosity) in zip(terpene_idxs, stage_idxs, colors):
+        saturation_adjustment, luminosity_adjustment = ADJUST[terpene_idx][stage_idx]
+        adjusted.append((saturation * saturation_adjustment, luminosity * luminosity_adjustment))
+    return adjusted
+
+
+def intensity_adjustments(intensity: float) -> tuple:
+    """Combine every stage adjustment with an apply_intensity_modifier intensity.
+
+    Returns a table shaped like ADJUST whose [i][s] entry is the stage's
+    (saturation, luminosity) factors scaled by the intensity's saturation and
+    luminosity modifiers, computed for all terpenes and stages in one pass.
+    """
+    saturation_modifier = intensity
+    luminosity_modifier = 0.7 + (intensity * 0.3)
+    return tuple(
+        tuple((sat * saturation_modifier, lum * luminosity_modifier) for sat, lum in row)
+        for row in ADJUST
+    )
+
+
+def _parse_duration(duration):
+    """Parse "0-2 hours" / "12+ hours" into (start, end) hours; "+" means open-ended."""
+    match = _DURATION_RE.fullmatch(duration)
+    if match is None:
+        raise ValueError(f"Unrecognized stage duration: {duration!r}")
+    start, end = match.groups()
+    return (int(start), int(end) if end is not None else math.inf)
+
+
+# DURATION_BOUNDS[i][s] == (start_hour, end_hour); the last stage ends at math.inf
+DURATION_BOUNDS = tuple(
+    tuple(_parse_duration(duration) for duration in row)
+    for row in _stage_column("duration")
+)
+_STAGE_ENDS = tuple(tuple(end for _, end in row) for row in DURATION_BOUNDS)
+
+
+def _stage_in(stage_ends, hours) -> int:
+    """Bisect elapsed hours into one terpene's stage ends, clamped to the last stage."""
+    if not hours >= 0:
+        raise ValueError("hours must be non-negative")
+    return min(bisect_right(stage_ends, hours), len(STAGES) - 1)
+
+
+def stage_at(terpene_idx: int, hours: float) -> int:
+    """Return the stage index terpene TERPENE_IDS[terpene_idx] is in after `hours`."""
+    return _stage_in(_STAGE_ENDS[terpene_idx], hours)
+
+
+def stages_at(terpene_idx: int, hours) -> list:
+    """Batched stage_at: map an iterable of elapsed hours to stage indexes in one pass."""
+    stage_ends = _STAGE_ENDS[terpene_idx]
+    return [_stage_in(stage_ends, elapsed) for elapsed in hours]
+
+
+class TerpeneStage(ctypes.Structure):
+    """C-layout stage record, equivalent to:
+
+        struct TerpeneStage {
+            float    sat_adj;
+            float    lum_adj;
+            uint8_t  edge_q;   /* EdgeQuality value */
+            uint16_t dur_lo;   /* stage start, hours */
+            uint16_t dur_hi;   /* stage end, hours; 0xFFFF when open-ended */
+        };
+    """
+
+    _fields_ = [
+        ("sat_adj", ctypes.c_float),
+        ("lum_adj", ctypes.c_float),
+        ("edge_q", ctypes.c_uint8),
+        ("dur_lo", ctypes.c_uint16),
+        ("dur_hi", ctypes.c_uint16),
+    ]
+
+
+_OPEN_ENDED_HOURS = 0xFFFF
+
+
+def _build_stage_structs():
+    """Pack every stage into one contiguous C array of TerpeneStage, shaped [n][4]."""
+    array = ((TerpeneStage * len(STAGES)) * len(TERPENE_IDS))()
+    for i, (adjust, edges, bounds) in enumerate(zip(ADJUST, EDGE_Q, DURATION_BOUNDS)):
+        for s, ((sat, lum), edge, (start, end)) in enumerate(zip(adjust, edges, bounds)):
+            dur_hi = _OPEN_ENDED_HOURS if end == math.inf else end
+            array[i][s] = TerpeneStage(sat, lum, edge, start, dur_hi)
+    return array
+
+
+# Zero-copy access for C/Cython consumers: memoryview(STAGE_STRUCTS) exposes the
+# buffer and ctypes.addressof(STAGE_STRUCTS) its base address.
+STAGE_STRUCTS = _build_stage_structs()
+
+
+def _interpolate(x, xs, ys):
+    """Piecewise-linear interpolation through (xs, ys), clamped outside the anchors."""
+    if x <= xs[0]:
+        return ys[0]
+    if x >= xs[-1]:
+        return ys[-1]
+    k = bisect_right(xs, x)
+    x0, x1, y0, y1 = xs[k - 1], xs[k], ys[k - 1], ys[k]
+    return y0 + (y1 - y0) * (x - x0) / (x1 - x0)
+
+
+def _build_adjustment_lut():
+    """Interpolate stage factors hour by hour between stage anchor points.
+
+    Each stage is anchored at its midpoint; the open-ended traces stage is
+    anchored where it begins, and factors hold steady after that.
+    """
+    hours = range(max(bounds[-1][0] for bounds in DURATION_BOUNDS) + 1)
+    lut = []
+    for bounds, adjust in zip(DURATION_BOUNDS, ADJUST):
+        anchors = [(start + end) / 2 for start, end in bounds[:-1]] + [bounds[-1][0]]
+        saturation = [sat for sat, _ in adjust]
+        luminosity = [lum for _, lum in adjust]
+        lut.append(tuple(
+            (_interpolate(h, anchors, saturation), _interpolate(h, anchors, luminosity))
+            for h in hours
+        ))
+    return tuple(lut)
+
+
+# ADJUST_LUT[i][h] == (saturation, luminosity) factors after h whole hours
+ADJUST_LUT = _build_adjustment_lut()
+
+
+def adjustments_at(terpene_idx: int, hours: float) -> tuple:
+    """Return continuously varying (saturation, luminosity) factors after `hours`."""
+    if not hours >= 0:
+        raise ValueError("hours must be non-negative")
+    row = ADJUST_LUT[terpene_idx]
+    if hours >= len(row) - 1:
+        return row[-1]
+    return row[int(hours)]
+
+
+@lru_cache(maxsize=4096)
+def _blend(terpene_idxs: tuple, hour: int) -> tuple:
+    factors = [adjustments_at(terpene_idx, hour) for terpene_idx in terpene_idxs]
+    return (
+        sum(sat for sat, _ in factors) / len(factors),
+        sum(lum for _, lum in factors) / len(factors),
+    )
+
+
+def blend_adjustments(terpene_names, hours: float) -> tuple:
+    """Average the (saturation, luminosity) factors of several terpenes after `hours`.
+
+    Results are memoized on the sorted row indexes and the whole hour, which is
+    the resolution of ADJUST_LUT, so bucketing loses nothing. Hours past the end
+    of the table share its last bucket.
+    """
+    terpene_idxs = []
+    for terpene_name in terpene_names:
+        terpene_idx = terpene_index(terpene_name)
+        if terpene_idx is None:
+            raise KeyError(f"Terpene '{terpene_name}' not found")
+        terpene_idxs.append(terpene_idx)
+    if not terpene_idxs:
+        raise ValueError("blend needs at least one terpene")
+    if not hours >= 0:
+        raise ValueError("hours must be non-negative")
+    return _blend(tuple(sorted(terpene_idxs)), int(min(hours, len(ADJUST_LUT[0]) - 1)))
+
+
+class TerpeneTable(NamedTuple):
+    """All derived columns in one immutable container, indexed by terpene row.
+
+    ids holds terpene ids (TERPENE_IDS), not the display names in TERPENE_NAMES.
+
+    Variable-length semantic bridges are stored CSR-style: row i's bridges are
+    bridges_flat[bridges_offsets[i]:bridges_offsets[i + 1]].
+    """
+
+    ids: Tuple[str, ...]
+    adjust: Tuple[Tuple[Tuple[float, float], ...], ...]
+    rgb: Tuple[Tuple[int, ...], ...]
+    weights: Tuple[Tuple[float, ...], ...]
+    duration_bounds: Tuple[Tuple[Tuple[int, float], ...], ...]
+    edge_q: Tuple[Tuple[EdgeQuality, ...], ...]
+    bridges_offsets: Tuple[int, ...]
+    bridges_flat: Tuple[str, ...]
+
+    def bridges(self, terpene_idx: int) -> Tuple[str, ...]:
+        """Return the semantic bridges of one terpene row."""
+        start, end = self.bridges_offsets[terpene_idx], self.bridges_offsets[terpene_idx + 1]
+        return self.bridges_flat[start:end]
+
+
+def _build_table():
+    """Assemble TABLE from the derived columns, flattening semantic bridges."""
+    offsets = [0]
+    flat = []
+    for terpene in TERPENES.values():
+        flat.extend(terpene["semantic_bridges"])
+        offsets.append(len(flat))
+    return TerpeneTable(
+        ids=TERPENE_IDS,
+        adjust=ADJUST,
+        rgb=PRIMARY_RGB,
+        weights=PALETTE_WEIGHTS,
+        duration_bounds=DURATION_BOUNDS,
+        edge_q=EDGE_Q,
+        bridges_offsets=tuple(offsets),
+        bridges_flat=tuple(flat),
+    )
+
+
+# The columns are shared with the module-level tables above, not copied.
+TABLE = _build_table()
+
 
 # ============================================================================
 # TOOLS
 # ============================================================================
 
+# Both encoders produce the same JSON values and layout, but float text can differ
+# (orjson writes 1e-05 as 0.00001), so responses echoing caller floats are only
+# JSON-equivalent across the two paths.
+if orjson is not None:
+    def _dumps(obj) -> str:
+        """Serialize a tool response as 2-space indented JSON."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+else:
+    def _dumps(obj) -> str:
+        """Serialize a tool response as 2-space indented JSON."""
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
+# Error responses keep json.dumps' compact one-line layout. Only the terpene name
+# varies, so it is the only part encoded per call.
+_COMPARE_NOT_FOUND = json.dumps({"error": "One or both terpenes not found"})
+_INTENSITY_OUT_OF_RANGE = json.dumps({"error": "Intensity must be between 0 and 1"})
+
+
+def _not_found(terpene_name: str) -> str:
+    return '{"error": ' + json.dumps(f"Terpene '{terpene_name}' not found") + "}"
+
+# Temporal-stage parameter annotation shared by the stage-aware tools, and every
+# value it admits (the four stages plus an explicit null) for precomputing responses
+_STAGE_LITERAL = Optional[Literal["fresh", "active", "fading", "traces"]]
+_STAGE_ARGS = STAGES + (None,)
+
+# Flat lookups so tools reach stage data and color specs in one hash probe. Like TERPENES,
+# every table below is read-only, so tools hand out shared references instead of copies.
+_STAGE_DATA = _FrozenDict(
+    ((terpene_id, stage), stage_data)
+    for terpene_id, terpene in TERPENES.items()
+    for stage, stage_data in terpene["temporal_qualities"]["stages"].items()
+)
+_COLOR_SPECS = _FrozenDict(
+    (terpene_id, terpene["color_specs"]) for terpene_id, terpene in TERPENES.items()
+)
+
+# Responses that depend only on the static database are serialized once at import.
+_LIST_TERPENES_JSON = _dumps([
+    {
+        "id": terpene_id,
+        "name": terpene_data["name"],
+        "formula": terpene_data["molecular_formula"],
+        "scent": terpene_data["scent_profile"],
+        "visual_character": terpene_data["visual_character"]
+    }
+    for terpene_id, terpene_data in TERPENES.items()
+])
+_TERPENE_JSON = _FrozenDict(
+    (terpene_id, _dumps(terpene)) for terpene_id, terpene in TERPENES.items()
+)
+
 @mcp.tool()
 def list_terpenes() -> str:
     """List all available terpenes with basic metadata."""
-    result = []
-    for terpene_id, terpene_data in TERPENES.items():
-        result.append({
-            "id": terpene_id,
-            "name": terpene_data["name"],
-            "formula": terpene_data["molecular_formula"],
-            "scent": terpene_data["scent_profile"],
-            "visual_character": terpene_data["visual_character"]
-        })
-    return json.dumps(result, indent=2)
+    return _LIST_TERPENES_JSON
 
 @mcp.tool()
 def get_terpene(terpene_name: str) -> str:
     """Get complete metadata for a specific terpene."""
-    terpene_id = terpene_name.lower().strip()
-    if terpene_id not in TERPENES:
-        return json.dumps({"error": f"Terpene '{terpene_name}' not found"})
-    return json.dumps(TERPENES[terpene_id], indent=2)
+    terpene_id = _resolve(terpene_name)
+    if terpene_id is None:
+        return _not_found(terpene_name)
+    return _TERPENE_JSON[terpene_id]
 
-@mcp.tool()
-def get_master_prompt(terpene_name: str, temporal_stage: Optional[Literal["fresh", "active", "fading", "traces"]] = "fresh") -> str:
-    """Get the master prompt for a terpene, optionally modified for temporal stage."""
-    terpene_id = terpene_name.lower().strip()
-    if terpene_id not in TERPENES:
-        return json.dumps({"error": f"Terpene '{terpene_name}' not found"})
-    
+# Stage-keyed caches are bounded: direct callers can pass stages outside the Literal.
+@lru_cache(maxsize=256)
+def _get_master_prompt_json(terpene_id: str, temporal_stage: Optional[str]) -> str:
     terpene = TERPENES[terpene_id]
     master = terpene["master_prompt"]
+    stage_data = _STAGE_DATA.get((terpene_id, temporal_stage))
     
     # Apply temporal stage adjustments to description
-    if temporal_stage != "fresh" and temporal_stage in terpene["temporal_qualities"]["stages"]:
-        stage_data = terpene["temporal_qualities"]["stages"][temporal_stage]
-        temporal_note = f"\n\n[{temporal_stage.upper()} STAGE: {stage_data['description']}]"
-        return json.dumps({
+    if temporal_stage != "fresh" and stage_data is not None:
+        temporal_note = f"[{temporal_stage.upper()} STAGE: {stage_data['description']}]"
+        return _dumps({
             "terpene": terpene["name"],
             "temporal_stage": temporal_stage,
-            "master_prompt": master + temporal_note,
+            "master_prompt": f"{master}\n\n{temporal_note}",
             "stage_adjustments": stage_data
-        }, indent=2)
+        })
     
-    return json.dumps({
+    return _dumps({
         "terpene": terpene["name"],
         "temporal_stage": temporal_stage,
         "master_prompt": master,
-        "stage_adjustments": terpene["temporal_qualities"]["stages"]["fresh"]
-    }, indent=2)
+        "stage_adjustments": _STAGE_DATA[terpene_id, "fresh"]
+    })
+
+# Every stage the schema admits (plus an explicit null) is serialized at import;
+# the cached builder only sees values that bypass tool-argument validation.
+_MASTER_PROMPT_JSON = _FrozenDict(
+    ((terpene_id, stage), _get_master_prompt_json(terpene_id, stage))
+    for terpene_id in TERPENE_IDS
+    for stage in _STAGE_ARGS
+)
+
+def _master_prompt_response(terpene_id: str, temporal_stage: Optional[str]) -> str:
+    response = _MASTER_PROMPT_JSON.get((terpene_id, temporal_stage))
+    if response is None:
+        response = _get_master_prompt_json(terpene_id, temporal_stage)
+    return response
+
+def _as_nested(response: str) -> str:
+    """Re-indent a serialized response so it nests one level deep in a _dumps document.
+
+    JSON strings never contain raw newlines, so shifting every line is exact.
+    """
+    return response.replace("\n", "\n  ")
 
 @mcp.tool()
-def get_color_palette(terpene_name: str, temporal_stage: Optional[Literal["fresh", "active", "fading", "traces"]] = "fresh") -> str:
-    """Get color palette specifications for a terpene, adjusted for temporal stage."""
-    terpene_id = terpene_name.lower().strip()
-    if terpene_id not in TERPENES:
-        return json.dumps({"error": f"Terpene '{terpene_name}' not found"})
-    
-    terpene = TERPENES[terpene_id]
-    palette = terpene["color_specs"].copy()
+def get_master_prompt(terpene_name: str, temporal_stage: _STAGE_LITERAL = "fresh") -> str:
+    """Get the master prompt for a terpene, optionally modified for temporal stage."""
+    terpene_id = _resolve(terpene_name)
+    if terpene_id is None:
+        return _not_found(terpene_name)
+    return _master_prompt_response(terpene_id, temporal_stage)
+
+def _master_prompts_bulk_json(terpene_names, temporal_stage: Optional[str]) -> str:
+    items = []
+    for terpene_name in terpene_names:
+        terpene_id = _resolve(terpene_name)
+        if terpene_id is None:
+            response = _dumps({"error": f"Terpene '{terpene_name}' not found"})
+        else:
+            response = _master_prompt_response(terpene_id, temporal_stage)
+        items.append(_as_nested(response))
+    if not items:
+        return "[]"
+    return "[\n  " + ",\n  ".join(items) + "\n]"
+
+@mcp.tool()
+def get_master_prompts_bulk(
+    terpene_names: List[str], temporal_stage: _STAGE_LITERAL = "fresh"
+) -> str:
+    """Get master prompts for several terpenes at one temporal stage in a single call."""
+    return _master_prompts_bulk_json(terpene_names, temporal_stage)
+
+def _all_at_stage_json(temporal_stage: Optional[str]) -> str:
+    members = [
+        f'"{terpene_id}": {_as_nested(_master_prompt_response(terpene_id, temporal_stage))}'
+        for terpene_id in TERPENE_IDS
+    ]
+    return "{\n  " + ",\n  ".join(members) + "\n}"
+
+# One document per stage covering every terpene, for clients that enumerate them all
+_ALL_AT_STAGE_JSON = _FrozenDict(
+    (stage, _all_at_stage_json(stage)) for stage in _STAGE_ARGS
+)
+
+@mcp.tool()
+def get_all_at_stage(temporal_stage: _STAGE_LITERAL = "fresh") -> str:
+    """Get the master prompt of every terpene at one temporal stage, keyed by terpene id."""
+    response = _ALL_AT_STAGE_JSON.get(temporal_stage)
+    if response is None:
+        response = _all_at_stage_json(temporal_stage)
+    return response
+
+@lru_cache(maxsize=256)
+def _get_color_palette_json(terpene_id: str, temporal_stage: Optional[str]) -> str:
+    palette = _COLOR_SPECS[terpene_id]
+    stage_data = _STAGE_DATA.get((terpene_id, temporal_stage))
     
-    # Apply temporal adjustments
-    if temporal_stage in terpene["temporal_qualities"]["stages"]:
-        stage_data = terpene["temporal_qualities"]["stages"][temporal_stage]
-        palette["temporal_adjustments"] = {
-            "saturation_multiplier": stage_data["saturation_adjustment"],
-            "luminosity_multiplier": stage_data["luminosity_adjustment"],
-            "edge_quality": stage_data["edge_quality"],
-            "stage_description": stage_data["description"]
+    # Apply temporal adjustments as an overlay; the frozen base is never copied
+    if stage_data is not None:
+        palette = {
+            **palette,
+            "temporal_adjustments": {
+                "saturation_multiplier": stage_data["saturation_adjustment"],
+                "luminosity_multiplier": stage_data["luminosity_adjustment"],
+                "edge_quality": stage_data["edge_quality"],
+                "stage_description": stage_data["description"]
+            }
         }
     
-    return json.dumps({
-        "terpene": terpene["name"],
+    return _dumps({
+        "terpene": TERPENES[terpene_id]["name"],
         "temporal_stage": temporal_stage,
         "color_specs": palette
-    }, indent=2)
+    })
+
+_COLOR_PALETTE_JSON = _FrozenDict(
+    ((terpene_id, stage), _get_color_palette_json(terpene_id, stage))
+    for terpene_id in TERPENE_IDS
+    for stage in _STAGE_ARGS
+)
 
 @mcp.tool()
-def get_temporal_stages(terpene_name: str) -> str:
-    """Get all temporal stages and their characteristics for a terpene."""
-    terpene_id = terpene_name.lower().strip()
-    if terpene_id not in TERPENES:
-        return json.dumps({"error": f"Terpene '{terpene_name}' not found"})
-    
-    terpene = TERPENES[terpene_id]
-    temporal = terpene["temporal_qualities"]
-    
-    result = {
+def get_color_palette(terpene_name: str, temporal_stage: _STAGE_LITERAL = "fresh") -> str:
+    """Get color palette specifications for a terpene, adjusted for temporal stage."""
+    terpene_id = _resolve(terpene_name)
+    if terpene_id is None:
+        return _not_found(terpene_name)
+    response = _COLOR_PALETTE_JSON.get((terpene_id, temporal_stage))
+    if response is None:
+        response = _get_color_palette_json(terpene_id, temporal_stage)
+    return response
+
+_TEMPORAL_STAGES_JSON = _FrozenDict(
+    (terpene_id, _dumps({
         "terpene": terpene["name"],
-        "volatility": temporal["volatility"],
-        "persistence": temporal["persistence"],
-        "stages": temporal["stages"]
-    }
-    
-    return json.dumps(result, indent=2)
+        "volatility": terpene["temporal_qualities"]["volatility"],
+        "persistence": terpene["temporal_qualities"]["persistence"],
+        "stages": terpene["temporal_qualities"]["stages"]
+    }))
+    for terpene_id, terpene in TERPENES.items()
+)
 
 @mcp.tool()
-def get_composition_rules(terpene_name: str) -> str:
-    """Get compositional and structural rules for a terpene."""
-    terpene_id = terpene_name.lower().strip()
-    if terpene_id not in TERPENES:
-        return json.dumps({"error": f"Terpene '{terpene_name}' not found"})
-    
-    terpene = TERPENES[terpene_id]
-    
-    return json.dumps({
+def get_temporal_stages(terpene_name: str) -> str:
+    """Get all temporal stages and their characteristics for a terpene."""
+    terpene_id = _resolve(terpene_name)
+    if terpene_id is None:
+        return _not_found(terpene_name)
+    return _TEMPORAL_STAGES_JSON[terpene_id]
+
+_COMPOSITION_RULES_JSON = _FrozenDict(
+    (terpene_id, _dumps({
         "terpene": terpene["name"],
         "molecular_structure": terpene["classification"],
         "formula": terpene["molecular_formula"],
         "composition": terpene["composition"],
         "semantic_bridges": terpene["semantic_bridges"],
         "fusion_strength": terpene["fusion_strength"]
-    }, indent=2)
+    }))
+    for terpene_id, terpene in TERPENES.items()
+)
 
 @mcp.tool()
-def compare_terpenes(terpene1_name: str, terpene2_name: str) -> str:
-    """Compare two terpenes across visual and olfactory dimensions."""
-    t1_id = terpene1_name.lower().strip()
-    t2_id = terpene2_name.lower().strip()
-    
-    if t1_id not in TERPENES or t2_id not in TERPENES:
-        return json.dumps({"error": "One or both terpenes not found"})
-    
+def get_composition_rules(terpene_name: str) -> str:
+    """Get compositional and structural rules for a terpene."""
+    terpene_id = _resolve(terpene_name)
+    if terpene_id is None:
+        return _not_found(terpene_name)
+    return _COMPOSITION_RULES_JSON[terpene_id]
+
+def _compare_terpenes_json(t1_id: str, t2_id: str) -> str:
     t1 = TERPENES[t1_id]
     t2 = TERPENES[t2_id]
     
@@ -804,100 +909,195 @@ def compare_terpenes(terpene1_name: str, terpene2_name: str) -> str:
         }
     }
     
-    return json.dumps(comparison, indent=2)
+    return _dumps(comparison)
+
+# Labels depend on argument order, so every ordered pair (self-pairs included) is built.
+_COMPARE_JSON = _FrozenDict(
+    ((t1_id, t2_id), _compare_terpenes_json(t1_id, t2_id))
+    for t1_id in TERPENE_IDS
+    for t2_id in TERPENE_IDS
+)
 
 @mcp.tool()
-def get_chemical_communication(terpene_name: str) -> str:
-    """Get the chemical communication/biological signaling aspect of a terpene."""
-    terpene_id = terpene_name.lower().strip()
-    if terpene_id not in TERPENES:
-        return json.dumps({"error": f"Terpene '{terpene_name}' not found"})
-    
-    terpene = TERPENES[terpene_id]
+def compare_terpenes(terpene1_name: str, terpene2_name: str) -> str:
+    """Compare two terpenes across visual and olfactory dimensions."""
+    t1_id = _resolve(terpene1_name)
+    t2_id = _resolve(terpene2_name)
     
-    return json.dumps({
+    if t1_id is None or t2_id is None:
+        return _COMPARE_NOT_FOUND
+    return _COMPARE_JSON[t1_id, t2_id]
+
+_CHEMICAL_COMMUNICATION_JSON = _FrozenDict(
+    (terpene_id, _dumps({
         "terpene": terpene["name"],
         "chemical_communication": terpene["chemical_communication"],
         "biological_role": terpene["scent_profile"],
         "visual_interpretation": terpene["master_prompt"][:200] + "..."
-    }, indent=2)
+    }))
+    for terpene_id, terpene in TERPENES.items()
+)
+
+@mcp.tool()
+def get_chemical_communication(terpene_name: str) -> str:
+    """Get the chemical communication/biological signaling aspect of a terpene."""
+    terpene_id = _resolve(terpene_name)
+    if terpene_id is None:
+        return _not_found(terpene_name)
+    return _CHEMICAL_COMMUNICATION_JSON[terpene_id]
+
+# Simple keyword matching to suggest terpenes
+_CONCEPT_KEYWORDS = _FrozenDict({
+    "limonene": ("bright", "visible", "broadcast", "radiant", "citrus", "energy"),
+    "pinene": ("defense", "defensive", "barrier", "fortress", "structure", "precise"),
+    "myrcene": ("flow", "organic", "movement", "dance", "growth", "earthy"),
+    "caryophyllene": ("complex", "sophisticated", "depth", "intelligent", "spiced", "warm"),
+    "linalool": ("delicate", "ethereal", "soft", "calming", "spiritual", "romantic"),
+    "terpinolene": ("fresh", "crisp", "sophisticated", "intellectual", "herbal"),
+    "humulene": ("grounded", "hoppy", "ferment", "transform", "natural"),
+    "ocimene": ("delicate", "flowing", "graceful", "energetic", "artistic"),
+    "sabinene": ("warm", "spiced", "dynamic", "heat", "pepper"),
+    "geraniol": ("romantic", "floral", "beautiful", "inviting", "blooming"),
+    "thymol": ("medicinal", "potent", "herbal", "historical", "intentional")
+})
+
+
+def _build_keyword_index():
+    """Invert _CONCEPT_KEYWORDS so each distinct keyword is scanned for only once."""
+    index = {}
+    for terpene_id, keywords in _CONCEPT_KEYWORDS.items():
+        for keyword in keywords:
+            index.setdefault(keyword, []).append(terpene_id)
+    return _FrozenDict((keyword, tuple(terpene_ids)) for keyword, terpene_ids in index.items())
+
+
+_KEYWORD_INDEX = _build_keyword_index()
+
+
+def _build_keyword_automaton():
+    """Compile _KEYWORD_INDEX into an Aho-Corasick automaton when pyahocorasick is installed."""
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword, terpene_ids in _KEYWORD_INDEX.items():
+        automaton.add_word(keyword, terpene_ids)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+def _concept_hits(concept_lower: str) -> set:
+    """Ids of terpenes with at least one keyword occurring as a substring of concept_lower."""
+    if _KEYWORD_AUTOMATON is not None:
+        return {
+            terpene_id
+            for _, terpene_ids in _KEYWORD_AUTOMATON.iter(concept_lower)
+            for terpene_id in terpene_ids
+        }
+    return {
+        terpene_id
+        for keyword, terpene_ids in _KEYWORD_INDEX.items()
+        if keyword in concept_lower
+        for terpene_id in terpene_ids
+    }
+
+# Default to showing the first five terpenes with fusion strength
+_DEFAULT_SUGGESTIONS = _freeze([
+    {
+        "terpene": TERPENES[t_id]["name"],
+        "terpene_id": t_id,
+        "fusion_strength": TERPENES[t_id]["fusion_strength"]
+    }
+    for t_id in TERPENE_IDS[:5]
+])
 
 @mcp.tool()
 def suggest_terpene_for_concept(concept: str) -> str:
     """Suggest terpenes that would pair well with a given concept."""
     concept_lower = concept.lower()
     
-    # Simple keyword matching to suggest terpenes
-    suggestions = []
-    
-    keyword_map = {
-        "bright|visible|broadcast|radiant|citrus|energy": "limonene",
-        "defense|defensive|barrier|fortress|structure|precise": "pinene",
-        "flow|organic|movement|dance|growth|earthy": "myrcene",
-        "complex|sophisticated|depth|intelligent|spiced|warm": "caryophyllene",
-        "delicate|ethereal|soft|calming|spiritual|romantic": "linalool",
-        "fresh|crisp|sophisticated|intellectual|herbal": "terpinolene",
-        "grounded|hoppy|ferment|transform|natural": "humulene",
-        "delicate|flowing|graceful|energetic|artistic": "ocimene",
-        "warm|spiced|dynamic|heat|pepper": "sabinene",
-        "romantic|floral|beautiful|inviting|blooming": "geraniol",
-        "medicinal|potent|herbal|historical|intentional": "thymol"
-    }
-    
-    for keywords, terpene_id in keyword_map.items():
-        if any(kw in concept_lower for kw in keywords.split("|")):
-            suggestions.append({
-                "terpene": TERPENES[terpene_id]["name"],
-                "terpene_id": terpene_id,
-                "reason": f"Concept contains '{concept}' which aligns with {TERPENES[terpene_id]['visual_character']} aesthetic"
-            })
+    hits = _concept_hits(concept_lower)
+    suggestions = [
+        {
+            "terpene": TERPENES[terpene_id]["name"],
+            "terpene_id": terpene_id,
+            "reason": f"Concept contains '{concept}' which aligns with {TERPENES[terpene_id]['visual_character']} aesthetic"
+        }
+        for terpene_id in _CONCEPT_KEYWORDS
+        if terpene_id in hits
+    ]
     
     if not suggestions:
-        # Default to showing all with fusion strength
-        suggestions = [
-            {
-                "terpene": TERPENES[t_id]["name"],
-                "terpene_id": t_id,
-                "fusion_strength": TERPENES[t_id]["fusion_strength"]
-            }
-            for t_id in list(TERPENES.keys())[:5]
-        ]
+        suggestions = _DEFAULT_SUGGESTIONS
     
-    return json.dumps({
+    return _dumps({
         "concept": concept,
         "suggestions": suggestions,
         "note": "These are suggestions based on semantic bridges. Try different terpenes to see which works best for your specific intent."
-    }, indent=2)
+    })
 
-@mcp.tool()
-def apply_intensity_modifier(terpene_name: str, intensity: float) -> str:
-    """Apply an intensity multiplier (0-1) to a terpene's color/saturation parameters."""
-    if not 0 <= intensity <= 1:
-        return json.dumps({"error": "Intensity must be between 0 and 1"})
-    
-    terpene_id = terpene_name.lower().strip()
-    if terpene_id not in TERPENES:
-        return json.dumps({"error": f"Terpene '{terpene_name}' not found"})
-    
+_INTENSITY_DESC = _FrozenDict({
+    0.0: "Ignored - use base prompt only",
+    0.25: "Subtle - gentle hints of terpene character",
+    0.5: "Balanced - terpene reshapes execution while subject remains primary",
+    0.75: "Strong - terpene properties heavily influence all aspects",
+    1.0: "Maximum - terpene dominates while subject remains recognizable"
+})
+
+# typed=True keeps 1 and 1.0 apart: they hash alike but serialize differently.
+@lru_cache(maxsize=2048, typed=True)
+def _apply_intensity_modifier_json(terpene_id: str, intensity: float) -> str:
     terpene = TERPENES[terpene_id]
     
-    return json.dumps({
+    return _dumps({
         "terpene": terpene["name"],
         "intensity_level": intensity,
-        "intensity_description": {
-            0.0: "Ignored - use base prompt only",
-            0.25: "Subtle - gentle hints of terpene character",
-            0.5: "Balanced - terpene reshapes execution while subject remains primary",
-            0.75: "Strong - terpene properties heavily influence all aspects",
-            1.0: "Maximum - terpene dominates while subject remains recognizable"
-        }.get(round(intensity, 2), f"Custom intensity {intensity}"),
+        "intensity_description": _INTENSITY_DESC.get(round(intensity, 2), f"Custom intensity {intensity}"),
         "application": {
             "saturation_modifier": intensity,
             "luminosity_modifier": 0.7 + (intensity * 0.3),
             "edge_softness_modifier": 1 - (intensity * 0.5),
             "composition_emphasis": "Minimal" if intensity < 0.3 else "Balanced" if intensity < 0.7 else "Maximum"
         }
-    }, indent=2)
+    })
+
+@mcp.tool()
+def apply_intensity_modifier(terpene_name: str, intensity: float) -> str:
+    """Apply an intensity multiplier (0-1) to a terpene's color/saturation parameters."""
+    if not 0 <= intensity <= 1:
+        return _INTENSITY_OUT_OF_RANGE
+    
+    terpene_id = _resolve(terpene_name)
+    if terpene_id is None:
+        return _not_found(terpene_name)
+    return _apply_intensity_modifier_json(terpene_id, intensity)
+
+@lru_cache(maxsize=256, typed=True)
+def _apply_intensity_modifier_bulk_json(intensity: float) -> str:
+    scaled = intensity_adjustments(intensity)
+    
+    return _dumps({
+        "intensity_level": intensity,
+        "edge_softness_modifier": 1 - (intensity * 0.5),
+        "terpenes": {
+            terpene_id: {
+                stage: {"saturation_multiplier": sat, "luminosity_multiplier": lum}
+                for stage, (sat, lum) in zip(STAGES, row)
+            }
+            for terpene_id, row in zip(TERPENE_IDS, scaled)
+        }
+    })
+
+@mcp.tool()
+def apply_intensity_modifier_bulk(intensity: float) -> str:
+    """Apply an intensity multiplier (0-1) to every terpene's stage adjustments at once."""
+    if not 0 <= intensity <= 1:
+        return _INTENSITY_OUT_OF_RANGE
+    return _apply_intensity_modifier_bulk_json(intensity)
 
 if __name__ == "__main__":
     mcp.run()
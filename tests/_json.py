@@ -0,0 +1,18 @@
+"""
+JSON helpers for tests that check serializability rather than stdlib's exact layout.
+
+Uses orjson when it is installed and falls back to the stdlib json module.
+"""
+
+try:
+    import orjson
+except ImportError:
+    import json
+
+    dumps = json.dumps
+    loads = json.loads
+else:
+    def dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    loads = orjson.loads
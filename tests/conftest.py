@@ -0,0 +1,37 @@
+"""
+Shared pytest fixtures for terpene-vocabulary-mcp tests.
+"""
+
+from types import MappingProxyType
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def terpenes():
+    """The terpene database, imported once per test session."""
+    from src.terpene_vocabulary.server import TERPENES
+    return TERPENES
+
+
+@pytest.fixture(scope="session")
+def terpene_records():
+    """The attribute-access Terpene records mirroring the database, keyed by terpene id."""
+    from src.terpene_vocabulary.server import TERPENE_RECORDS
+    return TERPENE_RECORDS
+
+
+@pytest.fixture(scope="session")
+def terpenes_lower(terpenes):
+    """Read-only lowercased mirror of each terpene's top-level text fields.
+
+    primary_colors is flattened to the lowercased text of the whole listing, so
+    substring checks can run against it directly.
+    """
+    return MappingProxyType({
+        terpene_id: MappingProxyType({
+            **{key: value.lower() for key, value in terpene.items() if isinstance(value, str)},
+            "primary_colors": str(terpene["primary_colors"]).lower(),
+        })
+        for terpene_id, terpene in terpenes.items()
+    })
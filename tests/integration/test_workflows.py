@@ -6,267 +6,360 @@ Tests actual MCP tool invocations and workflows.
 
 import pytest
 import json
-from src.terpene_vocabulary.server import TERPENES
+import re
+from collections import Counter
+from pathlib import Path
+from typing import get_args
+from src.terpene_vocabulary import server
+from src.terpene_vocabulary.server import TERPENE_IDS, TERPENE_NAMES
+from tests import _json
+
+# Keyword groups used to simulate concept matching, compiled once into a single
+# alternation; longest keywords first so a prefix never shadows a longer match
+KEYWORD_MAP = {
+    "lonely|isolated": "pinene",
+    "industrial|structure": "pinene",
+    "defense|defensive": "pinene"
+}
+KEYWORD_TO_TERPENE = {
+    keyword: terpene_id
+    for keywords, terpene_id in KEYWORD_MAP.items()
+    for keyword in keywords.split("|")
+}
+KEYWORD_RE = re.compile("|".join(
+    re.escape(keyword) for keyword in sorted(KEYWORD_TO_TERPENE, key=len, reverse=True)
+))
+
+# Vocabulary a text must mention at least once, each scanned in a single case-insensitive pass
+MASTER_PROMPT_WORDS_RE = re.compile("color|bright|saturated|composition|geometric", re.IGNORECASE)
+CHEMICAL_COMMUNICATION_WORDS_RE = re.compile(
+    "signal|attract|defense|communication|mark|presence|broadcast|growth|potency", re.IGNORECASE
+)
 
 
 class TestToolSimulation:
     """Simulate tool calls by directly accessing server logic."""
     
-    def test_list_terpenes_structure(self):
+    def test_list_terpenes_structure(self, terpenes):
         """list_terpenes should return valid JSON structure."""
-        # Simulate tool return
-        result = []
-        for terpene_id, terpene_data in TERPENES.items():
-            result.append({
-                "id": terpene_id,
-                "name": terpene_data["name"],
-                "formula": terpene_data["molecular_formula"],
-                "scent": terpene_data["scent_profile"],
-                "visual_character": terpene_data["visual_character"]
-            })
-        
-        # Should be serializable to JSON
-        json_str = json.dumps(result)
-        assert len(json_str) > 0
+        result = json.loads(server._LIST_TERPENES_JSON)
         
-        # Should have 11 entries
+        # Should have 11 entries, one per terpene, in database order
         assert len(result) == 11
+        assert tuple(entry["id"] for entry in result) == TERPENE_IDS
+        for entry in result:
+            assert set(entry) == {"id", "name", "formula", "scent", "visual_character"}
+            assert entry["name"] == terpenes[entry["id"]]["name"]
+            assert entry["formula"] == terpenes[entry["id"]]["molecular_formula"]
+    
+    def test_precomputed_responses_match_database(self, terpenes):
+        """Responses serialized at import should decode back to the database."""
+        listing = json.loads(server._LIST_TERPENES_JSON)
+        assert tuple(entry["id"] for entry in listing) == TERPENE_IDS
+        for terpene_id, terpene in terpenes.items():
+            restored = _json.loads(_json.dumps(terpene))
+            assert json.loads(server._TERPENE_JSON[terpene_id]) == restored
+            stages = json.loads(server._TEMPORAL_STAGES_JSON[terpene_id])
+            assert stages["stages"] == restored["temporal_qualities"]["stages"]
+            rules = json.loads(server._COMPOSITION_RULES_JSON[terpene_id])
+            assert rules["semantic_bridges"] == restored["semantic_bridges"]
+    
+    def test_stage_literal_matches_stages(self):
+        """The shared stage annotation should list the database stages in order."""
+        literal, none_type = get_args(server._STAGE_LITERAL)
+        assert get_args(literal) == server.STAGES
+        assert none_type is type(None)
+        assert server._STAGE_ARGS == server.STAGES + (None,)
+    
+    def test_chemical_communication_preview_truncated(self, terpenes):
+        """Precomputed chemical communication responses should carry a 200-char preview."""
+        for terpene_id, terpene in terpenes.items():
+            payload = json.loads(server._CHEMICAL_COMMUNICATION_JSON[terpene_id])
+            assert payload["visual_interpretation"] == terpene["master_prompt"][:200] + "..."
+    
+    def test_stage_responses_precomputed(self, terpenes):
+        """Every terpene/stage pair should be served from the import-time tables."""
+        for stage in server._STAGE_ARGS:
+            for terpene_id in terpenes:
+                prompt = json.loads(server._MASTER_PROMPT_JSON[terpene_id, stage])
+                palette = json.loads(server._COLOR_PALETTE_JSON[terpene_id, stage])
+                assert prompt["temporal_stage"] == palette["temporal_stage"] == stage
+                assert ("temporal_adjustments" in palette["color_specs"]) == (stage is not None)
+    
+    def test_bulk_master_prompts_match_single_lookups(self):
+        """The bulk response should equal a list of the single-terpene responses."""
+        names = ["Limonene", "unobtainium", "pinene"]
+        expected = [
+            json.loads(server._MASTER_PROMPT_JSON["limonene", "fading"]),
+            {"error": "Terpene 'unobtainium' not found"},
+            json.loads(server._MASTER_PROMPT_JSON["pinene", "fading"]),
+        ]
+        response = server._master_prompts_bulk_json(names, "fading")
+        assert json.loads(response) == expected
+        assert response == server._dumps(expected)
+        assert server._master_prompts_bulk_json([], "fresh") == "[]"
+    
+    def test_all_at_stage_matches_single_lookups(self, terpenes):
+        """Each per-stage document should hold every terpene's master prompt response."""
+        for stage in server._STAGE_ARGS:
+            expected = {
+                terpene_id: json.loads(server._MASTER_PROMPT_JSON[terpene_id, stage])
+                for terpene_id in terpenes
+            }
+            assert json.loads(server._ALL_AT_STAGE_JSON[stage]) == expected
+            assert server._ALL_AT_STAGE_JSON[stage] == server._dumps(expected)
+    
+    def test_compare_payloads_cover_ordered_pairs(self, terpenes):
+        """Every ordered pair should have a precomputed comparison labelled in call order."""
+        assert len(server._COMPARE_JSON) == len(terpenes) ** 2
+        forward = json.loads(server._COMPARE_JSON["limonene", "linalool"])
+        backward = json.loads(server._COMPARE_JSON["linalool", "limonene"])
+        assert forward["terpene1"] == backward["terpene2"] == "Limonene"
+    
+    def test_tool_tables_are_read_only(self):
+        """Shared lookup tables handed to tools should reject mutation."""
+        with pytest.raises(TypeError):
+            server._STAGE_DATA["limonene", "fresh"] = {}
+        with pytest.raises(TypeError):
+            server._COLOR_SPECS["limonene"]["saturation"] = "Low"
+        with pytest.raises(TypeError):
+            server._DEFAULT_SUGGESTIONS[0]["terpene"] = "Other"
     
-    def test_get_terpene_returns_complete_data(self):
+    def test_not_found_matches_json_dumps(self):
+        """Hand-assembled error responses should equal the json.dumps they replace."""
+        for name in ["unobtainium", 'quote"d', "back\\slash", "ünïcode", ""]:
+            expected = json.dumps({"error": f"Terpene '{name}' not found"})
+            assert server._not_found(name) == expected
+    
+    def test_dumps_matches_stdlib_layout(self, terpenes):
+        """_dumps should emit JSON-equivalent text whether or not orjson is installed."""
+        terpene = terpenes["limonene"]
+        assert server._dumps(terpene) == json.dumps(terpene, indent=2, ensure_ascii=False)
+        
+        # Echoed caller floats may be spelled differently (0.00001 vs 1e-05),
+        # so intensity responses are only compared as decoded values
+        response = json.loads(server._apply_intensity_modifier_json("limonene", 1e-5))
+        assert response["intensity_level"] == 1e-5
+        assert response["application"]["saturation_modifier"] == 1e-5
+    
+    def test_get_terpene_returns_complete_data(self, terpenes):
         """get_terpene should return complete terpene data."""
-        terpene = TERPENES["limonene"]
+        terpene = terpenes["limonene"]
         
-        # Should be JSON serializable
-        json_str = json.dumps(terpene)
-        assert len(json_str) > 0
+        # The precomputed tool response should carry the whole entry
+        assert json.loads(server._TERPENE_JSON["limonene"]).keys() == terpene.keys()
         
         # Should have all expected fields
         assert terpene["name"] == "Limonene"
         assert "C₁₀H₁₆" in terpene["molecular_formula"]
     
-    def test_get_master_prompt_with_temporal_stage(self):
+    def test_get_master_prompt_with_temporal_stage(self, terpenes):
         """get_master_prompt should adjust for temporal stages."""
-        terpene = TERPENES["limonene"]
+        terpene = terpenes["limonene"]
         master = terpene["master_prompt"]
         
         # Master should be substantial
         assert len(master) > 100
         
         # Should describe visual properties
-        assert any(word in master.lower() for word in 
-                  ["color", "bright", "saturated", "composition", "geometric"])
+        assert MASTER_PROMPT_WORDS_RE.search(master)
     
     def test_temporal_stage_adjustments(self):
         """Temporal stages should provide adjustment multipliers."""
-        for terpene_id, terpene in TERPENES.items():
-            stages = terpene["temporal_qualities"]["stages"]
-            
+        # ADJUST[i][s] is the stage's (saturation, luminosity) pair; unit tests tie it to the dicts
+        fresh, fading, traces = (server.STAGE_IDX[stage] for stage in ("fresh", "fading", "traces"))
+        for terpene_id, row in zip(server.TERPENE_IDS, server.ADJUST):
             # Fresh should be at maximum intensity (1.0)
-            fresh = stages["fresh"]
-            assert fresh["saturation_adjustment"] == 1.0
-            assert fresh["luminosity_adjustment"] == 1.0
+            assert row[fresh] == (1.0, 1.0), terpene_id
             
             # Fading should be reduced
-            fading = stages["fading"]
-            assert fading["saturation_adjustment"] < 1.0
-            assert fading["luminosity_adjustment"] < 1.0
+            saturation, luminosity = row[fading]
+            assert saturation < 1.0 and luminosity < 1.0, terpene_id
             
             # Traces should be minimal
-            traces = stages["traces"]
-            assert traces["saturation_adjustment"] < 0.5
-            assert traces["luminosity_adjustment"] < 0.9
+            saturation, luminosity = row[traces]
+            assert saturation < 0.5 and luminosity < 0.9, terpene_id
     
-    def test_color_palette_transformation(self):
+    def test_color_palette_transformation(self, terpene_records):
         """Color palette should be transformable with adjustments."""
-        terpene = TERPENES["caryophyllene"]
+        terpene = terpene_records["caryophyllene"]
         
         # Get base color specs
-        color_specs = terpene["color_specs"]
+        color_specs = terpene.color_specs
         
         # Apply fading stage adjustment
-        fading = terpene["temporal_qualities"]["stages"]["fading"]
-        sat_mult = fading["saturation_adjustment"]
-        lum_mult = fading["luminosity_adjustment"]
+        fading = terpene.temporal_qualities.stages[server.STAGE_IDX["fading"]]
+        sat_mult = fading.saturation_adjustment
+        lum_mult = fading.luminosity_adjustment
         
         # Adjustments should be reasonable (reduced from fresh)
         assert 0.5 <= sat_mult <= 0.7  # Reduced from 1.0
         assert 0.75 <= lum_mult <= 0.85  # Slight reduction
     
-    def test_intensity_modifier_calculation(self):
+    def test_intensity_modifier_calculation(self, terpenes):
         """Intensity modifiers should scale terpene influence."""
         # Simulate apply_intensity_modifier logic
-        terpene = TERPENES["limonene"]
+        terpene = terpenes["limonene"]
         
-        for intensity in [0.0, 0.25, 0.5, 0.75, 1.0]:
-            # Simulate intensity application
-            saturation_modifier = intensity
-            luminosity_modifier = 0.7 + (intensity * 0.3)
-            edge_softness_modifier = 1 - (intensity * 0.5)
-            
-            # Check ranges
-            assert 0 <= saturation_modifier <= 1
-            assert 0.7 <= luminosity_modifier <= 1.0
-            assert 0.5 <= edge_softness_modifier <= 1.0
+        # Grid of 0.05 steps, which includes the quarter points exactly
+        intensities = [step / 20 for step in range(21)]
+        saturation_modifiers = intensities
+        luminosity_modifiers = [0.7 + (intensity * 0.3) for intensity in intensities]
+        edge_softness_modifiers = [1 - (intensity * 0.5) for intensity in intensities]
+        
+        # Check ranges; every modifier is linear, so the extremes bound the grid
+        assert 0 <= min(saturation_modifiers) and max(saturation_modifiers) <= 1
+        assert 0.7 <= min(luminosity_modifiers) and max(luminosity_modifiers) <= 1.0
+        assert 0.5 <= min(edge_softness_modifiers) and max(edge_softness_modifiers) <= 1.0
     
-    def test_terpene_comparison_structure(self):
+    def test_cached_intensity_keeps_int_and_float_apart(self):
+        """Memoized intensity responses should echo the caller's exact value."""
+        as_int = json.loads(server._apply_intensity_modifier_json("limonene", 1))
+        as_float = json.loads(server._apply_intensity_modifier_json("limonene", 1.0))
+        assert isinstance(as_int["intensity_level"], int)
+        assert isinstance(as_float["intensity_level"], float)
+        assert as_int["intensity_description"] == server._INTENSITY_DESC[1.0]
+    
+    def test_bulk_intensity_scales_every_stage(self, terpenes):
+        """The bulk intensity response should cover every terpene and stage."""
+        result = json.loads(server._apply_intensity_modifier_bulk_json(0.5))
+        assert result["edge_softness_modifier"] == 0.75
+        assert tuple(result["terpenes"]) == TERPENE_IDS
+        for terpene_id, terpene in terpenes.items():
+            for stage, stage_data in terpene["temporal_qualities"]["stages"].items():
+                scaled = result["terpenes"][terpene_id][stage]
+                assert scaled["saturation_multiplier"] == pytest.approx(
+                    stage_data["saturation_adjustment"] * 0.5)
+                assert scaled["luminosity_multiplier"] == pytest.approx(
+                    stage_data["luminosity_adjustment"] * 0.85)
+    
+    def test_terpene_comparison_structure(self, terpenes):
         """Terpene comparison should return valid structure."""
-        t1 = TERPENES["limonene"]
-        t2 = TERPENES["linalool"]
+        comparison = json.loads(server._COMPARE_JSON["limonene", "linalool"])
+        t1 = terpenes["limonene"]
+        t2 = terpenes["linalool"]
         
-        comparison = {
-            "terpene1": t1["name"],
-            "terpene2": t2["name"],
-            "comparison": {
-                "scent_profiles": {
-                    "terpene1": t1["scent_profile"],
-                    "terpene2": t2["scent_profile"]
-                },
-                "visual_character": {
-                    "terpene1": t1["visual_character"],
-                    "terpene2": t2["visual_character"]
-                },
-                "saturation_range": {
-                    "terpene1": t1["color_specs"]["saturation"],
-                    "terpene2": t2["color_specs"]["saturation"]
-                }
-            }
+        # Each compared aspect should pair both terpenes' values
+        assert comparison["terpene1"] == t1["name"]
+        assert comparison["terpene2"] == t2["name"]
+        assert set(comparison["comparison"]) == {
+            "scent_profiles", "visual_character", "primary_colors", "saturation_range",
+            "luminosity_range", "volatility", "composition_style"
+        }
+        for aspect in comparison["comparison"].values():
+            assert set(aspect) == {"terpene1", "terpene2"}
+            assert all(aspect.values())
+        assert comparison["comparison"]["scent_profiles"] == {
+            "terpene1": t1["scent_profile"], "terpene2": t2["scent_profile"]
         }
-        
-        # Should be JSON serializable
-        json_str = json.dumps(comparison)
-        assert len(json_str) > 0
     
     def test_concept_matching_logic(self):
         """Concept suggestion should find semantic bridges."""
         concept = "A lonely figure in an abandoned industrial city"
         concept_lower = concept.lower()
         
-        # Simulate keyword matching
-        keyword_map = {
-            "lonely|isolated": "pinene",
-            "industrial|structure": "pinene",
-            "defense|defensive": "pinene"
-        }
-        
-        matches = []
-        for keywords, terpene_id in keyword_map.items():
-            if any(kw in concept_lower for kw in keywords.split("|")):
-                matches.append(terpene_id)
+        # Simulate keyword matching in one pass over the concept
+        matches = {KEYWORD_TO_TERPENE[m.group()] for m in KEYWORD_RE.finditer(concept_lower)}
         
         # Should match pinene for this concept
         assert "pinene" in matches
     
-    def test_chemical_communication_retrieval(self):
+    def test_concept_hits_match_substring_scan(self):
+        """Keyword lookup should agree with a plain substring scan, automaton or not."""
+        concepts = ["A warm, spiced fortress at dusk", "softly flowing", "nothing relevant", ""]
+        for concept in concepts:
+            concept_lower = concept.lower()
+            expected = {
+                terpene_id
+                for terpene_id, keywords in server._CONCEPT_KEYWORDS.items()
+                if any(keyword in concept_lower for keyword in keywords)
+            }
+            assert server._concept_hits(concept_lower) == expected
+    
+    @pytest.mark.parametrize("terpene_id", TERPENE_IDS)
+    def test_chemical_communication_retrieval(self, terpene_id, terpenes):
         """Chemical communication should describe biological role."""
-        for terpene_id, terpene in TERPENES.items():
-            chem_comm = terpene.get("chemical_communication", "")
-            
-            # Should be non-empty
-            assert len(chem_comm) > 0
-            
-            # Should contain meaningful keywords related to terpene function
-            assert any(word in chem_comm.lower() for word in 
-                      ["signal", "attract", "defense", "communication", "mark", "presence", "broadcast", "growth", "potency"])
+        chem_comm = terpenes[terpene_id].get("chemical_communication", "")
+        
+        # Should be non-empty
+        assert len(chem_comm) > 0
+        
+        # Should contain meaningful keywords related to terpene function
+        assert CHEMICAL_COMMUNICATION_WORDS_RE.search(chem_comm), terpene_id
 
 
 
 class TestWorkflowSimulation:
     """Simulate complete workflows using server data."""
     
-    def test_path1_workflow(self):
-        """Simulate Path 1 (pre-generation) workflow."""
-        # User selects terpene
-        selected_terpene = "limonene"
-        temporal_stage = "fresh"
-        intensity = 0.5
-        
-        # Step 1: Get terpene
-        terpene = TERPENES[selected_terpene]
-        assert terpene is not None
-        
-        # Step 2: Get master prompt
-        master_prompt = terpene["master_prompt"]
-        assert len(master_prompt) > 0
-        
-        # Step 3: Apply intensity
-        saturation_mod = intensity
-        composition_emphasis = "Strong" if intensity > 0.5 else "Balanced"
-        
-        # Step 4: Would fuse with LLM (not tested here)
-        # Step 5: Would generate image (not tested here)
-        
-        # Verify workflow logic
-        assert master_prompt is not None
-        assert saturation_mod == 0.5
+    def test_workflow_selects_from_full_listing(self, terpene_records):
+        """Workflows start by selecting from the full list of terpenes."""
+        assert len(terpene_records) == 11
     
-    def test_path2_workflow(self):
-        """Simulate Path 2 (post-generation discovery) workflow."""
-        original_prompt = "A woman remembering a lost love"
-        
-        # Step 1: Get list of terpenes
-        terpenes_list = list(TERPENES.keys())
-        assert len(terpenes_list) == 11
+    @pytest.mark.parametrize("terpene_id,stage,intensity", [
+        ("limonene", "fresh", 0.5),     # Path 1: pre-generation
+        ("linalool", "fading", 0.3),    # Path 2: post-generation discovery
+        ("pinene", "active", 0.8),
+        ("ocimene", "traces", 1.0),
+    ])
+    def test_workflow(self, terpene_records, terpene_id, stage, intensity):
+        """Simulate selecting a terpene, then adjusting its stage and intensity."""
+        # Step 1: Select a terpene from the list
+        terpene = terpene_records[terpene_id]
         
-        # Step 2: User selects terpene
-        selected = "linalool"
-        terpene = TERPENES[selected]
+        # Step 2: Get master prompt
+        assert len(terpene.master_prompt) > 0
         
-        # Step 3: Get master prompt
-        master = terpene["master_prompt"]
-        assert len(master) > 0
+        # Step 3: Adjust temporal stage
+        stage_data = terpene.temporal_qualities.stages[server.STAGE_IDX[stage]]
+        saturation = stage_data.saturation_adjustment
+        assert 0 <= saturation <= 1
+        if stage != "fresh":
+            assert saturation < 1.0
         
-        # Step 4: Adjust temporal stage
-        new_stage = "fading"
-        stage_data = terpene["temporal_qualities"]["stages"][new_stage]
+        # Step 4: Apply intensity
+        applied = json.loads(server._apply_intensity_modifier_json(terpene_id, intensity))
+        assert applied["intensity_level"] == intensity
+        assert applied["application"]["saturation_modifier"] == intensity
+        assert applied["application"]["luminosity_modifier"] == pytest.approx(0.7 + 0.3 * intensity)
         
-        # Step 5: Would regenerate with adjustments
-        assert stage_data["saturation_adjustment"] < 1.0
+        # Step 5: Would fuse with LLM and regenerate (not tested here)
     
-    def test_comparison_workflow(self):
+    @pytest.mark.parametrize("t1_id,t2_id", [
+        ("limonene", "linalool"),
+        ("pinene", "myrcene"),
+        ("ocimene", "thymol"),
+    ])
+    def test_comparison_workflow(self, terpene_records, t1_id, t2_id):
         """Simulate terpene comparison in discovery mode."""
-        t1_id = "limonene"
-        t2_id = "linalool"
-        
-        t1 = TERPENES[t1_id]
-        t2 = TERPENES[t2_id]
-        
-        # Create comparison
-        comparison = {
-            "t1_name": t1["name"],
-            "t2_name": t2["name"],
-            "t1_saturation": t1["color_specs"]["saturation"],
-            "t2_saturation": t2["color_specs"]["saturation"],
-            "t1_luminosity": t1["color_specs"]["luminosity"],
-            "t2_luminosity": t2["color_specs"]["luminosity"],
-        }
+        t1 = terpene_records[t1_id]
+        t2 = terpene_records[t2_id]
         
         # Verify they're different
-        assert comparison["t1_name"] != comparison["t2_name"]
-        assert comparison["t1_saturation"] != comparison["t2_saturation"]
+        assert t1.name != t2.name
+        assert t1.color_specs.saturation != t2.color_specs.saturation
 
 
 class TestJSONSerialization:
     """Test that all terpene data is JSON serializable."""
     
-    def test_all_terpenes_serializable(self):
-        """All terpene data should be JSON serializable."""
-        for terpene_id, terpene in TERPENES.items():
-            try:
-                json_str = json.dumps(terpene)
-                assert len(json_str) > 0
-            except TypeError as e:
-                pytest.fail(f"Terpene {terpene_id} not JSON serializable: {e}")
+    def test_all_data_json_serializable(self, terpenes):
+        """The whole terpene database should serialize in one pass."""
+        encoded = _json.dumps(terpenes)
+        assert all(f'"{terpene_id}":' in encoded for terpene_id in TERPENE_IDS)
+    
+    def test_adjustment_table_serializable(self):
+        """The flat stage adjustment table should encode in one call, rows intact."""
+        decoded = _json.loads(_json.dumps(server.ADJUST))
+        assert decoded == [[list(pair) for pair in row] for row in server.ADJUST]
     
-    def test_serialized_terpene_structure_preserved(self):
+    def test_serialized_terpene_structure_preserved(self, terpenes):
         """Structure should be preserved after JSON round-trip."""
-        for terpene_id, terpene in TERPENES.items():
-            json_str = json.dumps(terpene)
-            restored = json.loads(json_str)
-            
-            # Key fields should be preserved
-            assert restored["name"] == terpene["name"]
-            assert restored["molecular_formula"] == terpene["molecular_formula"]
-            assert len(restored["temporal_qualities"]["stages"]) == 4
+        # One round trip of the whole tree, checked against the file it was loaded from
+        source = json.loads(Path(server.__file__).with_name("terpenes.json").read_bytes())
+        assert _json.loads(_json.dumps(terpenes)) == source
+        for terpene in terpenes.values():
+            assert len(terpene["temporal_qualities"]["stages"]) == 4
 
 
 class TestDataConsistency:
@@ -274,23 +367,30 @@ class TestDataConsistency:
     
     def test_no_duplicate_names(self):
         """No two terpenes should have the same name."""
-        names = [t["name"] for t in TERPENES.values()]
-        assert len(names) == len(set(names))
+        counts = Counter(TERPENE_NAMES)
+        duplicates = [name for name, count in counts.items() if count > 1]
+        assert not duplicates, f"Duplicate terpene names: {duplicates}"
+    
+    @pytest.mark.parametrize("terpene_id", TERPENE_IDS)
+    def test_no_duplicate_bridges(self, terpene_id, terpenes):
+        """A terpene should not list the same semantic bridge twice."""
+        counts = Counter(terpenes[terpene_id]["semantic_bridges"])
+        duplicates = [bridge for bridge, count in counts.items() if count > 1]
+        assert not duplicates, f"Duplicate bridges in {terpene_id}: {duplicates}"
     
-    def test_consistent_classification_format(self):
+    def test_consistent_classification_format(self, terpenes_lower):
         """All classifications should follow consistent format."""
-        for terpene_id, terpene in TERPENES.items():
+        for terpene_id, terpene in terpenes_lower.items():
             classification = terpene["classification"]
             # Should contain terpene type and structure info
-            assert "terpene" in classification.lower()
+            assert "terpene" in classification
     
-    def test_all_bridges_reasonable_length(self):
+    @pytest.mark.parametrize("terpene_id", TERPENE_IDS)
+    def test_all_bridges_reasonable_length(self, terpene_id, terpenes):
         """Semantic bridges should be reasonable length."""
-        for terpene_id, terpene in TERPENES.items():
-            bridges = terpene["semantic_bridges"]
-            for bridge in bridges:
-                assert 5 < len(bridge) < 50, \
-                    f"Bridge '{bridge}' in {terpene_id} has unusual length"
+        for bridge in terpenes[terpene_id]["semantic_bridges"]:
+            assert 5 < len(bridge) < 50, \
+                f"Bridge '{bridge}' in {terpene_id} has unusual length"
 
 
 if __name__ == "__main__":
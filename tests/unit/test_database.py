@@ -4,123 +4,250 @@ Unit tests for terpene-vocabulary-mcp server
 Tests core functionality of terpene lookups and tool operations.
 """
 
+import ctypes
 import pytest
 import json
+import math
+import random
 from src.terpene_vocabulary.server import (
-    TERPENES,
+    TERPENE_IDS,
+    TERPENE_IDX,
+    TERPENE_NAMES,
+    STAGES,
+    terpene_index,
+    STAGE_IDX,
+    ADJUST,
+    EDGE_QUALITY,
+    ADJUST_Q7,
+    apply_q7,
+    STAGE_RECORDS,
+    TERPENE_RECORDS,
+    EDGE_Q,
+    EdgeQuality,
+    DURATION_BOUNDS,
+    stage_at,
+    stages_at,
+    adjustments_at,
+    blend_adjustments,
+    TABLE,
+    STAGE_STRUCTS,
+    TerpeneStage,
+    apply_adjustments,
+    batch_apply,
+    intensity_adjustments,
+    PRIMARY_RGB,
+    rgb_for,
+    PALETTE_NAMES,
+    PALETTE_WEIGHTS,
+    SAT_RANGE,
+    LUM_RANGE,
+    sample_saturation,
+    sample_luminosity,
+    COLOR_QUALITY_IDS,
+    COLOR_QUALITY_FACTORS,
+    terpenes_with_color_quality,
+    terpenes_for_concept,
     mcp
 )
 
 
+REQUIRED_FIELDS = frozenset([
+    "name",
+    "molecular_formula",
+    "classification",
+    "scent_profile",
+    "visual_character",
+    "primary_colors",
+    "color_specs",
+    "composition",
+    "temporal_qualities",
+    "master_prompt",
+    "chemical_communication",
+    "fusion_strength",
+    "semantic_bridges"
+])
+REQUIRED_STAGES = frozenset(["fresh", "active", "fading", "traces"])
+REQUIRED_STAGE_FIELDS = frozenset([
+    "duration",
+    "description",
+    "saturation_adjustment",
+    "luminosity_adjustment",
+    "edge_quality"
+])
+FUSION_LEVELS = frozenset(["Weak", "Medium", "Medium-strong", "Strong", "Very strong"])
+REQUIRED_COLOR_FIELDS = (
+    "primary_palette",
+    "saturation",
+    "luminosity",
+    "boundaries",
+    "secondary_accents",
+    "color_quality"
+)
+
+_TEXT = {"type": "string", "minLength": 1}
+_FACTOR = {"type": "number", "minimum": 0, "maximum": 1}
+
+# One terpene entry as JSON Schema; covers the structure checks above in a single pass
+TERPENE_SCHEMA = {
+    "type": "object",
+    "required": sorted(REQUIRED_FIELDS),
+    "properties": {
+        "name": _TEXT,
+        "molecular_formula": _TEXT,
+        "classification": _TEXT,
+        "scent_profile": _TEXT,
+        "visual_character": _TEXT,
+        "primary_colors": {"type": "array", "items": _TEXT, "minItems": 1},
+        "color_specs": {
+            "type": "object",
+            "required": list(REQUIRED_COLOR_FIELDS),
+            "properties": {field: {"type": "string"} for field in REQUIRED_COLOR_FIELDS},
+        },
+        "composition": _TEXT,
+        "temporal_qualities": {
+            "type": "object",
+            "required": ["volatility", "persistence", "stages"],
+            "properties": {
+                "stages": {
+                    "type": "object",
+                    "required": sorted(REQUIRED_STAGES),
+                    "additionalProperties": {
+                        "type": "object",
+                        "required": sorted(REQUIRED_STAGE_FIELDS),
+                        "properties": {
+                            "duration": _TEXT,
+                            "description": _TEXT,
+                            "saturation_adjustment": _FACTOR,
+                            "luminosity_adjustment": _FACTOR,
+                            "edge_quality": _TEXT,
+                        },
+                    },
+                },
+            },
+        },
+        "master_prompt": {"type": "string", "minLength": 101},
+        "chemical_communication": _TEXT,
+        "fusion_strength": {"type": "string", "pattern": "Weak|Medium|Strong"},
+        "semantic_bridges": {"type": "array", "items": _TEXT, "minItems": 1},
+    },
+}
+
+
 class TestTerpeneDatabase:
     """Test the terpene database structure and content."""
     
-    def test_terpene_database_not_empty(self):
+    def test_terpene_database_not_empty(self, terpenes):
         """Terpene database should contain entries."""
-        assert len(TERPENES) > 0
-        assert len(TERPENES) == 11  # Exactly 11 terpenes
+        assert len(terpenes) > 0
+        assert len(terpenes) == 11  # Exactly 11 terpenes
     
-    def test_terpene_ids_valid(self):
+    @pytest.mark.parametrize("terpene_id", TERPENE_IDS)
+    def test_terpene_ids_valid(self, terpene_id):
         """All terpene IDs should be lowercase alphanumeric."""
-        for terpene_id in TERPENES.keys():
-            assert terpene_id.islower()
-            assert terpene_id.replace('_', '').isalnum()
+        assert terpene_id.islower()
+        assert terpene_id.replace('_', '').isalnum()
     
-    def test_required_fields_present(self):
+    @pytest.mark.parametrize("terpene_id", TERPENE_IDS)
+    def test_required_fields_present(self, terpene_id, terpenes):
         """Each terpene should have all required fields."""
-        required_fields = [
-            "name",
-            "molecular_formula",
-            "classification",
-            "scent_profile",
-            "visual_character",
-            "primary_colors",
-            "color_specs",
-            "composition",
-            "temporal_qualities",
-            "master_prompt",
-            "chemical_communication",
-            "fusion_strength",
-            "semantic_bridges"
-        ]
-        
-        for terpene_id, terpene in TERPENES.items():
-            for field in required_fields:
-                assert field in terpene, f"Missing field '{field}' in {terpene_id}"
+        missing = REQUIRED_FIELDS - terpenes[terpene_id].keys()
+        assert not missing, f"Missing fields {sorted(missing)} in {terpene_id}"
     
-    def test_temporal_stages_complete(self):
+    @pytest.mark.parametrize("terpene_id", TERPENE_IDS)
+    def test_temporal_stages_complete(self, terpene_id, terpenes):
         """Each terpene should have all 4 temporal stages."""
-        required_stages = ["fresh", "active", "fading", "traces"]
-        
-        for terpene_id, terpene in TERPENES.items():
-            stages = terpene["temporal_qualities"]["stages"]
-            for stage in required_stages:
-                assert stage in stages, f"Missing stage '{stage}' in {terpene_id}"
+        missing = REQUIRED_STAGES - terpenes[terpene_id]["temporal_qualities"]["stages"].keys()
+        assert not missing, f"Missing stages {sorted(missing)} in {terpene_id}"
     
-    def test_temporal_stage_fields(self):
+    def test_temporal_stage_fields(self, terpenes):
         """Each temporal stage should have required fields."""
-        required_stage_fields = [
-            "duration",
-            "description",
-            "saturation_adjustment",
-            "luminosity_adjustment",
-            "edge_quality"
-        ]
-        
-        for terpene_id, terpene in TERPENES.items():
+        for terpene_id, terpene in terpenes.items():
             for stage_name, stage_data in terpene["temporal_qualities"]["stages"].items():
-                for field in required_stage_fields:
-                    assert field in stage_data, \
-                        f"Missing field '{field}' in {terpene_id} stage {stage_name}"
+                missing = REQUIRED_STAGE_FIELDS - stage_data.keys()
+                assert not missing, \
+                    f"Missing fields {sorted(missing)} in {terpene_id} stage {stage_name}"
     
     def test_adjustment_values_valid(self):
         """Adjustment multipliers should be between 0 and 1."""
-        for terpene_id, terpene in TERPENES.items():
-            for stage_name, stage_data in terpene["temporal_qualities"]["stages"].items():
-                sat = stage_data["saturation_adjustment"]
-                lum = stage_data["luminosity_adjustment"]
+        # ADJUST packs every stage's (saturation, luminosity) pair in STAGES order
+        for terpene_id, row in zip(TERPENE_IDS, ADJUST):
+            for stage_name, (sat, lum) in zip(STAGES, row):
                 assert 0 <= sat <= 1, \
                     f"Invalid saturation adjustment in {terpene_id} {stage_name}: {sat}"
                 assert 0 <= lum <= 1, \
                     f"Invalid luminosity adjustment in {terpene_id} {stage_name}: {lum}"
     
-    def test_semantic_bridges_not_empty(self):
+    def test_semantic_bridges_not_empty(self, terpenes):
         """Each terpene should have semantic bridges."""
-        for terpene_id, terpene in TERPENES.items():
+        for terpene_id, terpene in terpenes.items():
             bridges = terpene.get("semantic_bridges", [])
             assert len(bridges) > 0, f"No semantic bridges for {terpene_id}"
-            assert all(isinstance(b, str) for b in bridges)
+        # One pass over every bridge; exact type match, no subclass check needed
+        bridge_types = {type(b) for t in terpenes.values() for b in t["semantic_bridges"]}
+        assert bridge_types == {str}
+
+    def test_entries_match_schema(self, terpenes):
+        """Every entry should validate against the compiled terpene schema."""
+        fastjsonschema = pytest.importorskip("fastjsonschema")
+        validate = fastjsonschema.compile(TERPENE_SCHEMA)
+        for terpene_id, terpene in terpenes.items():
+            try:
+                validate(terpene)
+            except fastjsonschema.JsonSchemaException as e:
+                pytest.fail(f"{terpene_id} does not match schema: {e.message}")
+    
+    def test_database_is_read_only(self, terpenes):
+        """The database should reject mutation at every level."""
+        with pytest.raises(TypeError):
+            terpenes["limonene"] = {}
+        with pytest.raises(TypeError):
+            terpenes["limonene"]["color_specs"]["saturation"] = "Low"
+        with pytest.raises(TypeError):
+            terpenes["limonene"]["temporal_qualities"]["stages"]["fresh"].update({})
+    
+    
+    def test_typed_records_mirror_database(self, terpenes):
+        """Typed records should expose the same values by attribute."""
+        assert tuple(TERPENE_RECORDS) == TERPENE_IDS
+        for terpene_id, terpene in terpenes.items():
+            record = TERPENE_RECORDS[terpene_id]
+            assert record.name == terpene["name"]
+            assert record.color_specs._asdict() == terpene["color_specs"]
+            temporal = record.temporal_qualities
+            assert temporal.volatility == terpene["temporal_qualities"]["volatility"]
+            assert len(temporal.stages) == len(STAGES)
+            assert not hasattr(record, "__dict__")
 
 
 class TestSpecificTerpenes:
     """Test specific terpene entries for correctness."""
     
-    def test_limonene_properties(self):
+    def test_limonene_properties(self, terpenes_lower):
         """Limonene should have characteristic properties."""
-        limonene = TERPENES["limonene"]
-        assert "citrus" in limonene["scent_profile"].lower()
-        assert "yellow" in str(limonene["primary_colors"]).lower()
-        assert "radial" in limonene["visual_character"].lower()
+        limonene = terpenes_lower["limonene"]
+        assert "citrus" in limonene["scent_profile"]
+        assert "yellow" in limonene["primary_colors"]
+        assert "radial" in limonene["visual_character"]
     
-    def test_pinene_properties(self):
+    def test_pinene_properties(self, terpenes_lower):
         """Pinene should have characteristic properties."""
-        pinene = TERPENES["pinene"]
-        assert "woody" in pinene["scent_profile"].lower()
-        assert "green" in str(pinene["primary_colors"]).lower()
-        assert "geometric" in pinene["visual_character"].lower()
+        pinene = terpenes_lower["pinene"]
+        assert "woody" in pinene["scent_profile"]
+        assert "green" in pinene["primary_colors"]
+        assert "geometric" in pinene["visual_character"]
     
-    def test_myrcene_properties(self):
+    def test_myrcene_properties(self, terpenes_lower):
         """Myrcene should have characteristic properties."""
-        myrcene = TERPENES["myrcene"]
-        assert "earthy" in myrcene["scent_profile"].lower()
-        assert "brown" in str(myrcene["primary_colors"]).lower()
-        assert "flowing" in myrcene["visual_character"].lower()
+        myrcene = terpenes_lower["myrcene"]
+        assert "earthy" in myrcene["scent_profile"]
+        assert "brown" in myrcene["primary_colors"]
+        assert "flowing" in myrcene["visual_character"]
     
-    def test_master_prompt_length(self):
+    @pytest.mark.parametrize("terpene_id", TERPENE_IDS)
+    def test_master_prompt_length(self, terpene_id, terpenes):
         """Master prompts should be substantial."""
-        for terpene_id, terpene in TERPENES.items():
-            prompt = terpene["master_prompt"]
-            assert len(prompt) > 100, f"Master prompt too short for {terpene_id}"
+        prompt = terpenes[terpene_id]["master_prompt"]
+        assert len(prompt) > 100, f"Master prompt too short for {terpene_id}"
 
 
 class TestToolIntegration:
@@ -142,54 +269,253 @@ class TestToolIntegration:
 class TestTerpeneColorSpecs:
     """Test color specification formatting."""
     
-    def test_color_specs_structure(self):
+    def test_color_specs_structure(self, terpenes):
         """Color specs should have consistent structure."""
-        required_color_fields = [
-            "primary_palette",
-            "saturation",
-            "luminosity",
-            "boundaries",
-            "secondary_accents",
-            "color_quality"
-        ]
-        
-        for terpene_id, terpene in TERPENES.items():
+        for terpene_id, terpene in terpenes.items():
             color_specs = terpene["color_specs"]
-            for field in required_color_fields:
+            for field in REQUIRED_COLOR_FIELDS:
                 assert field in color_specs, \
                     f"Missing color field '{field}' in {terpene_id}"
                 # Each should be a string description
                 assert isinstance(color_specs[field], str)
+    
+    def test_color_quality_factor_pool(self, terpenes):
+        """Pooled factors should rebuild each color_quality description."""
+        for terpene_id, factor_ids in zip(TERPENE_IDS, COLOR_QUALITY_IDS):
+            rebuilt = ", ".join(COLOR_QUALITY_FACTORS[k] for k in factor_ids)
+            assert rebuilt == terpenes[terpene_id]["color_specs"]["color_quality"].lower()
+        
+        assert terpenes_with_color_quality("Delicate") == ("linalool", "ocimene", "geraniol")
+        assert terpenes_with_color_quality("no such quality") == ()
+    
+    def test_primary_colors_have_rgb(self, terpenes):
+        """Every primary color should map to a packed 24-bit RGB value."""
+        for terpene_id, rgbs in zip(TERPENE_IDS, PRIMARY_RGB):
+            assert len(rgbs) == len(terpenes[terpene_id]["primary_colors"])
+            assert all(0 <= rgb <= 0xFFFFFF for rgb in rgbs)
+    
+    def test_rgb_for_unpacks_channels(self):
+        """rgb_for should unpack channels in R, G, B order."""
+        limonene = rgb_for(TERPENE_IDX["limonene"])
+        assert limonene[0] == (0xFF, 0xE8, 0x4D)  # Saturated yellow
+        assert limonene[2] == (255, 255, 255)  # Bright white
+    
+    def test_palette_weights_normalized(self):
+        """Parsed palette weights should align with names and sum to 1."""
+        for terpene_id, names, weights in zip(TERPENE_IDS, PALETTE_NAMES, PALETTE_WEIGHTS):
+            assert len(names) == len(weights) > 0, f"Empty palette for {terpene_id}"
+            assert sum(weights) == pytest.approx(1.0)
+        
+        limonene = TERPENE_IDX["limonene"]
+        assert PALETTE_NAMES[limonene] == ("Saturated yellows", "oranges", "whites/highlights")
+        assert PALETTE_WEIGHTS[limonene] == pytest.approx((0.6, 0.25, 0.15))
+    
+    def test_color_ranges_parsed(self):
+        """Saturation/luminosity ranges should parse to ordered fractions."""
+        assert SAT_RANGE[TERPENE_IDX["limonene"]] == (0.75, 0.95)
+        assert LUM_RANGE[TERPENE_IDX["limonene"]] == (0.8, 0.9)
+        for low, high in SAT_RANGE + LUM_RANGE:
+            assert 0 <= low < high <= 1
+    
+    def test_color_range_sampling(self):
+        """Sampled values should fall inside the terpene's range."""
+        rng = random.Random(0)
+        for i in range(len(TERPENE_IDS)):
+            low, high = SAT_RANGE[i]
+            assert low <= sample_saturation(i, rng) <= high
+            low, high = LUM_RANGE[i]
+            assert low <= sample_luminosity(i, rng) <= high
 
 
 class TestSemanticBridges:
     """Test semantic bridge quality."""
     
-    def test_bridges_are_meaningful(self):
+    @pytest.mark.parametrize("terpene_id", TERPENE_IDS)
+    def test_bridges_are_meaningful(self, terpene_id, terpenes):
         """Semantic bridges should relate to terpene properties."""
-        for terpene_id, terpene in TERPENES.items():
-            bridges = terpene["semantic_bridges"]
-            # At least some bridges should appear in visual character
-            visual_char_lower = terpene["visual_character"].lower()
-            # Don't strictly require match—bridges are creative
-            # but verify they're non-empty strings
-            assert all(len(b.strip()) > 0 for b in bridges)
+        bridges = terpenes[terpene_id]["semantic_bridges"]
+        # Don't require bridges to appear in visual character—bridges are creative
+        # but verify they're non-empty strings
+        assert all(len(b.strip()) > 0 for b in bridges)
+    
+    def test_bridge_index_lookup(self, terpenes):
+        """Bridge phrases and their words should resolve to owning terpenes."""
+        assert terpenes_for_concept("broadcasting") == {"limonene"}
+        assert terpenes_for_concept("Earthy Grounding") == {"myrcene", "humulene"}
+        assert "limonene" in terpenes_for_concept("citrus")
+        assert terpenes_for_concept("no such bridge") == frozenset()
+        for terpene_id, terpene in terpenes.items():
+            for bridge in terpene["semantic_bridges"]:
+                assert terpene_id in terpenes_for_concept(bridge)
+                assert terpene_id in terpenes_for_concept(bridge.upper())
 
 
 class TestFusionStrength:
     """Test fusion strength descriptors."""
     
-    def test_fusion_strength_valid(self):
+    def test_fusion_strength_valid(self, terpenes):
         """All fusion strengths should be valid descriptions."""
-        valid_strengths = [
-            "Weak", "Medium", "Strong", "Very strong"
-        ]
-        
-        for terpene_id, terpene in TERPENES.items():
+        for terpene_id, terpene in terpenes.items():
             strength = terpene.get("fusion_strength", "")
             assert len(strength) > 0, f"Empty fusion strength for {terpene_id}"
-            # Should contain some indication of strength
-            assert any(word in strength for word in ["Weak", "Medium", "Strong"])
+            # Should lead with a known strength level, e.g. "Strong - works well with ..."
+            level = strength.partition(" - ")[0]
+            assert level in FUSION_LEVELS, f"Unknown fusion strength {level!r} for {terpene_id}"
+
+
+class TestDerivedTables:
+    """Test the index-aligned tables derived from the database."""
+    
+    def test_indexes_match_database_order(self, terpenes):
+        """Row and stage indexes should follow database order."""
+        assert TERPENE_IDS == tuple(terpenes.keys())
+        assert TERPENE_NAMES == tuple(t["name"] for t in terpenes.values())
+        assert all(TERPENE_IDX[tid] == i for i, tid in enumerate(TERPENE_IDS))
+        assert all(STAGE_IDX[stage] == s for s, stage in enumerate(STAGES))
+    
+    def test_terpene_index_lookup(self):
+        """terpene_index should accept ids or display names and reject unknowns."""
+        assert terpene_index("pinene") == TERPENE_IDX["pinene"]
+        assert terpene_index(" Pinene ") == TERPENE_IDX["pinene"]
+        assert terpene_index("unobtainium") is None
+    
+    def test_stage_tables_match_database(self, terpenes):
+        """Stage tables should mirror the nested stage dicts."""
+        for terpene_id, terpene in terpenes.items():
+            i = TERPENE_IDX[terpene_id]
+            for stage, stage_data in terpene["temporal_qualities"]["stages"].items():
+                s = STAGE_IDX[stage]
+                assert ADJUST[i][s] == (
+                    stage_data["saturation_adjustment"],
+                    stage_data["luminosity_adjustment"]
+                )
+                assert EDGE_QUALITY[i][s] == stage_data["edge_quality"]
+                assert EDGE_Q[i][s].label == stage_data["edge_quality"]
+                assert STAGE_RECORDS[i][s]._asdict() == stage_data
+    
+    def test_edge_quality_enum_ordered(self):
+        """Edge qualities should order from sharpest to softest."""
+        assert EdgeQuality.from_label("Sharp") < EdgeQuality.from_label("Soft")
+        assert max(EdgeQuality) is EdgeQuality.VERY_SOFT
+        # Fresh stages are never softer than the traces that follow them
+        assert all(row[0] <= row[-1] for row in EDGE_Q)
+    
+    def test_table_bridges_csr(self, terpenes):
+        """TABLE should expose each terpene's bridges through CSR offsets."""
+        assert TABLE.ids == TERPENE_IDS
+        assert len(TABLE.bridges_offsets) == len(TERPENE_IDS) + 1
+        for i, terpene_id in enumerate(TERPENE_IDS):
+            assert TABLE.bridges(i) == terpenes[terpene_id]["semantic_bridges"]
+    
+    def test_stage_structs_layout(self):
+        """The C stage array should be contiguous and mirror the tables."""
+        view = memoryview(STAGE_STRUCTS)
+        assert view.c_contiguous
+        assert view.nbytes == len(TERPENE_IDS) * len(STAGES) * ctypes.sizeof(TerpeneStage)
+        
+        limonene = STAGE_STRUCTS[TERPENE_IDX["limonene"]]
+        assert limonene[0].sat_adj == 1.0
+        assert limonene[1].sat_adj == pytest.approx(0.85)
+        assert limonene[3].edge_q == EdgeQuality.VERY_SOFT
+        assert (limonene[1].dur_lo, limonene[1].dur_hi) == (2, 6)
+        assert limonene[3].dur_hi == 0xFFFF
+    
+    def test_duration_bounds_contiguous(self):
+        """Stage durations should start at 0 and chain without gaps."""
+        for terpene_id, bounds in zip(TERPENE_IDS, DURATION_BOUNDS):
+            assert bounds[0][0] == 0, f"{terpene_id} does not start at hour 0"
+            for (_, end), (start, _) in zip(bounds, bounds[1:]):
+                assert end == start, f"Gap between stages in {terpene_id}"
+            assert bounds[-1][1] == float("inf")
+    
+    def test_stage_at(self):
+        """stage_at should map elapsed hours onto stage indexes."""
+        limonene = TERPENE_IDX["limonene"]  # 0-2, 2-6, 6-12, 12+ hours
+        assert stage_at(limonene, 0) == STAGE_IDX["fresh"]
+        assert stage_at(limonene, 2) == STAGE_IDX["active"]
+        assert stage_at(limonene, 11.5) == STAGE_IDX["fading"]
+        assert stage_at(limonene, 500) == STAGE_IDX["traces"]
+        assert stage_at(limonene, math.inf) == STAGE_IDX["traces"]
+        with pytest.raises(ValueError):
+            stage_at(limonene, -1)
+        with pytest.raises(ValueError):
+            stage_at(limonene, math.nan)
+    
+    def test_stages_at_matches_stage_at(self):
+        """The batched lookup should agree with per-value stage_at."""
+        hours = [0, 1.5, 4, 8, 12, 24, 36, 48, 72, 100, math.inf]
+        for i in range(len(TERPENE_IDS)):
+            assert stages_at(i, hours) == [stage_at(i, h) for h in hours]
+        with pytest.raises(ValueError):
+            stages_at(0, [1, math.nan])
+    
+    def test_adjustments_at_interpolates(self):
+        """Time-based factors should pass through stage anchors and only fade."""
+        limonene = TERPENE_IDX["limonene"]  # anchors at 1, 4, 9 and 12 hours
+        assert adjustments_at(limonene, 1) == ADJUST[limonene][STAGE_IDX["fresh"]]
+        assert adjustments_at(limonene, 4) == ADJUST[limonene][STAGE_IDX["active"]]
+        assert adjustments_at(limonene, 1000) == ADJUST[limonene][STAGE_IDX["traces"]]
+        assert adjustments_at(limonene, math.inf) == ADJUST[limonene][STAGE_IDX["traces"]]
+        with pytest.raises(ValueError):
+            adjustments_at(limonene, math.nan)
+        midway = adjustments_at(limonene, 6.5)
+        assert 0.5 < midway[0] < 0.85
+        
+        for i in range(len(TERPENE_IDS)):
+            saturation = [adjustments_at(i, h)[0] for h in range(100)]
+            assert saturation == sorted(saturation, reverse=True)
+    
+    def test_blend_adjustments(self):
+        """Blending should average factors and ignore terpene order."""
+        limonene = adjustments_at(TERPENE_IDX["limonene"], 5)
+        pinene = adjustments_at(TERPENE_IDX["pinene"], 5)
+        blended = blend_adjustments(["limonene", "Pinene"], 5.9)
+        expected = ((limonene[0] + pinene[0]) / 2, (limonene[1] + pinene[1]) / 2)
+        assert blended == pytest.approx(expected)
+        assert blend_adjustments(["pinene", "limonene"], 5) == blended
+        assert blend_adjustments(["thymol"], 0) == (1.0, 1.0)
+        assert blend_adjustments(["limonene"], math.inf) == adjustments_at(
+            TERPENE_IDX["limonene"], math.inf
+        )
+        with pytest.raises(ValueError):
+            blend_adjustments(["limonene"], math.nan)
+        with pytest.raises(KeyError):
+            blend_adjustments(["limonene", "unobtainium"], 5)
+    
+    def test_batch_apply_matches_single(self):
+        """Batched adjustment should match applying each pair individually."""
+        terpene_idxs = [TERPENE_IDX["limonene"], TERPENE_IDX["pinene"], TERPENE_IDX["thymol"]]
+        stage_idxs = [STAGE_IDX["fresh"], STAGE_IDX["fading"], STAGE_IDX["traces"]]
+        colors = [(0.9, 0.8), (0.7, 0.6), (0.5, 0.5)]
+        
+        batched = batch_apply(terpene_idxs, stage_idxs, colors)
+        assert batched == [
+            apply_adjustments(sat, lum, i, s)
+            for i, s, (sat, lum) in zip(terpene_idxs, stage_idxs, colors)
+        ]
+        assert batched[0] == (0.9, 0.8)  # fresh stage is unadjusted
+        assert batched[1] == pytest.approx((0.7 * 0.5, 0.6 * 0.75))
+    
+    def test_intensity_adjustments_scale_every_stage(self):
+        """Whole-table intensity scaling should match scaling each stage factor."""
+        scaled = intensity_adjustments(0.5)
+        assert len(scaled) == len(ADJUST)
+        for row, scaled_row in zip(ADJUST, scaled):
+            for (sat, lum), (scaled_sat, scaled_lum) in zip(row, scaled_row):
+                assert scaled_sat == pytest.approx(sat * 0.5)
+                assert scaled_lum == pytest.approx(lum * 0.85)
+        assert intensity_adjustments(1.0) == ADJUST
+    
+    def test_fixed_point_adjustments(self):
+        """Q1.7 factors should track the float factors within rounding error."""
+        for row, row_q7 in zip(ADJUST, ADJUST_Q7):
+            for factors, factors_q7 in zip(row, row_q7):
+                for factor, factor_q7 in zip(factors, factors_q7):
+                    assert abs(factor_q7 / 128 - factor) <= 1 / 256
+        
+        limonene, fresh = TERPENE_IDX["limonene"], STAGE_IDX["fresh"]
+        assert apply_q7(255, limonene, fresh, 0) == 255  # full strength is lossless
+        assert apply_q7(200, limonene, STAGE_IDX["fading"], 0) == 100  # 0.5 saturation
 
 
 if __name__ == "__main__":